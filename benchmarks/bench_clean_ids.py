@@ -0,0 +1,85 @@
+"""
+Benchmark ID column cleaning on a synthetic full season of `pbp` data.
+
+Compares `nfldata._clean_IDs` against the column-by-column pandas
+implementation it replaced, given the same declared ID types. Run it from
+the repository root, with `foopy` importable from the source tree:
+
+    PYTHONPATH=. python benchmarks/bench_clean_ids.py [--rows 50000] [--repeat 5]
+
+or after `pip install -e .`, without `PYTHONPATH`.
+"""
+
+import argparse
+import time
+import numpy
+import pandas
+
+from foopy.nfldata import nfldata
+
+
+# =======================
+# Previous Implementation
+# =======================
+
+
+def clean_IDs_pandas(data_name: str, df: pandas.DataFrame) -> pandas.DataFrame:
+    for column in nfldata.ID_COLUMNS[data_name]:
+        if column not in df.columns:
+            continue
+        notna = df[column].notna() & (df[column] != "")
+        if nfldata.ID_COLUMNS[data_name][column] == int:
+            df.loc[notna, column] = df.loc[notna, column].astype(int).astype(str)
+        else:
+            df.loc[notna, column] = df.loc[notna, column].astype(str)
+        df[column] = df[column].replace("", None)
+    return df
+
+
+# ===========
+# Fake Season
+# ===========
+
+
+def fake_pbp_season(rows: int, seed: int = 0) -> pandas.DataFrame:
+    """
+    Create a `pbp` frame of `rows` plays with every ID column, mostly missing player IDs as in real data.
+    """
+    rng = numpy.random.default_rng(seed)
+    players = numpy.array(
+        [f"00-00{number:05d}" for number in range(2000)], dtype=object
+    )
+    data = {}
+    for column, id_type in nfldata.PBP_ID_COLUMNS.items():
+        if id_type == int:
+            data[column] = rng.integers(1, 5000, rows).astype(float)
+        else:
+            values = players[rng.integers(0, len(players), rows)]
+            values[rng.random(rows) < 0.8] = None
+            data[column] = values
+    data["epa"] = rng.normal(size=rows)
+    return pandas.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    df = fake_pbp_season(args.rows)
+    print(f"{args.rows} rows, {len(nfldata.PBP_ID_COLUMNS)} ID columns")
+    results = {}
+    for name, func in [("pandas", clean_IDs_pandas), ("arrow", nfldata._clean_IDs)]:
+        seconds = []
+        for _ in range(args.repeat):
+            copy = df.copy()
+            start = time.perf_counter()
+            func("pbp", copy)
+            seconds.append(time.perf_counter() - start)
+        results[name] = min(seconds)
+        print(f"{name:<8}{results[name]:>8.3f}s")
+    print(f"speedup {results['pandas'] / results['arrow']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+============
+Command Line
+============
+
+Commands
+
+* `foopy cache warm --datasets pbp,roster,schedule --seasons 2002-2024 --jobs 8`
+
+    Fill the cache for the given datasets and seasons. `--mirror DIR` fills it from a local mirror of nflverse release files instead of the network.
+"""
+
+import argparse
+import concurrent.futures
+import sys
+import time
+
+# nfldata is imported lazily so that `foopy --help` starts quickly.
+from . import nfldata
+
+
+# ==============
+# Argument Types
+# ==============
+
+
+def _parse_datasets(text: str) -> list[str]:
+    """
+    Parse a comma separated list of data names, e.g. `pbp,roster`.
+    """
+    from .nfldata import nfldata as _nfldata
+
+    data_names = [data_name.strip() for data_name in text.split(",") if data_name]
+    for data_name in data_names:
+        if data_name not in _nfldata.DATA_NAMES_VALUES:
+            raise argparse.ArgumentTypeError(f'Dataset "{data_name}" invalid.')
+    return data_names
+
+
+def _parse_seasons(text: str) -> list[int]:
+    """
+    Parse a comma separated list of seasons and season ranges, e.g. `2002-2010,2015`.
+    """
+    seasons = []
+    for part in text.split(","):
+        try:
+            if "-" in part:
+                first, last = part.split("-", 1)
+                seasons += range(int(first), int(last) + 1)
+            else:
+                seasons.append(int(part))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'Seasons "{part}" invalid.')
+    return list(dict.fromkeys(seasons))
+
+
+def _format_bytes(nbytes: int) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if nbytes < 1024 or unit == "GB":
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+
+
+# ==================
+# Cache Warm Command
+# ==================
+
+
+def _warm_partition(data_name: str, season: int | None, update: bool) -> dict:
+    """
+    Prefetch a single season of `data_name`, or the non-years data if `season` is `None`, and time it.
+    """
+    start = time.perf_counter()
+    years = None if season is None else [season]
+    dumped = nfldata.prefetch(data_name, years, update)
+    seconds = time.perf_counter() - start
+    entries = nfldata.cache_info(data_name)
+    if season is None:
+        entries = entries[entries["season"].isna()]
+    else:
+        entries = entries[entries["season"] == season]
+    return {
+        "data_name": data_name,
+        "season": season,
+        "status": "fetched" if dumped else "cached",
+        "seconds": seconds,
+        "files": len(entries.index),
+        "bytes": int(entries["bytes"].sum()),
+    }
+
+
+def _print_partition(result: dict):
+    season = "-" if result["season"] is None else result["season"]
+    print(
+        f"{result['data_name']:<9}{season!s:<7}{result['status']:<9}"
+        f"{result['seconds']:>8.2f}s{result['files']:>6} files"
+        f"{_format_bytes(result['bytes']):>12}",
+        flush=True,
+    )
+
+
+def cache_warm(args: argparse.Namespace) -> int:
+    """
+    Fill the cache for `args.datasets` and `args.seasons` with `args.jobs` threads, printing the timing and size of each partition as it finishes.
+    """
+    from .nfldata import nfldata as _nfldata
+
+    partitions = []
+    for data_name in args.datasets:
+        if data_name in _nfldata.YEARS_DATA_NAMES:
+            if not args.seasons:
+                print(f"--seasons is required for {data_name}.", file=sys.stderr)
+                return 2
+            partitions += [(data_name, season) for season in args.seasons]
+        else:
+            partitions.append((data_name, None))
+    if args.mirror is not None:
+        nfldata.set_source(nfldata.MirrorSource(args.mirror))
+    failed = 0
+    results = []
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(_warm_partition, data_name, season, args.update): (
+                data_name,
+                season,
+            )
+            for data_name, season in partitions
+        }
+        for future in concurrent.futures.as_completed(futures):
+            data_name, season = futures[future]
+            try:
+                result = future.result()
+            except Exception as error:
+                failed += 1
+                print(f"{data_name:<9}{season!s:<7}failed   {error}", file=sys.stderr)
+                continue
+            results.append(result)
+            _print_partition(result)
+    fetched = sum(result["status"] == "fetched" for result in results)
+    total_bytes = sum(result["bytes"] for result in results)
+    print(
+        f"{len(results)} partitions ({fetched} fetched, {len(results) - fetched} "
+        f"cached, {failed} failed) in {time.perf_counter() - start:.2f}s, "
+        f"{_format_bytes(total_bytes)}"
+    )
+    return 1 if failed else 0
+
+
+# ===========
+# Entry Point
+# ===========
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="foopy", description="Football analytics")
+    commands = parser.add_subparsers(dest="command", required=True)
+    cache = commands.add_parser("cache", help="Manage the nfldata cache.")
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    warm = cache_commands.add_parser(
+        "warm", help="Fill the cache, skipping partitions that are already cached."
+    )
+    warm.add_argument(
+        "--datasets",
+        type=_parse_datasets,
+        default=["pbp", "roster", "schedule"],
+        help="Comma separated data names (default: pbp,roster,schedule).",
+    )
+    warm.add_argument(
+        "--seasons",
+        type=_parse_seasons,
+        help="Comma separated seasons and ranges, e.g. 2002-2024.",
+    )
+    warm.add_argument(
+        "--jobs", type=int, default=1, help="Partitions to fill concurrently."
+    )
+    warm.add_argument(
+        "--update",
+        action="store_true",
+        help="Fetch the latest cached season again.",
+    )
+    warm.add_argument(
+        "--mirror",
+        help="Fill the cache from this local mirror of nflverse release files.",
+    )
+    warm.set_defaults(func=cache_warm)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "jobs", 1) < 1:
+        parser.error("--jobs must be at least 1.")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
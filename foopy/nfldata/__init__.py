@@ -9,14 +9,127 @@ Functions
 
     Set the directory where cache will be stored.
 
+* `set_cache_format()`
+
+    Set the file format of the cache (`parquet` or `arrow-ipc`).
+
+* `set_source()`
+
+    Set where data that is not cached is fetched from.
+
+* `set_shared_store()`
+
+    Set a store shared between machines for the cache to read through.
+
+* `set_cache_budget()`
+
+    Set the disk budget of the cache.
+
 * `load()`
 
     Load NFL data.
 
+* `load_iter()`
+
+    Load NFL data as an iterator of season, week or fixed size chunks.
+
+* `load_async()`
+
+    Load NFL data without blocking the asyncio event loop.
+
+* `load_many_async()`
+
+    Load several datasets concurrently without blocking the asyncio event loop.
+
+* `prefetch()`
+
+    Fill the cache without loading any data.
+
+* `cache_info()`
+
+    Get what is cached.
+
+* `prune_cache()`
+
+    Recompress and evict seasons until the cache is within budget.
+
+* `pin_cache()`
+
+    Pin seasons so they are never evicted.
+
+* `id_dictionary()`
+
+    Get the IDs behind the integer codes of ID columns loaded with `id_encoding`.
+
+* `team_dtype()`
+
+    Get the categorical dtype of team columns loaded with `canonical_teams`.
+
+* `set_memory_cache()`
+
+    Set the memory budget for loaded frames kept in memory.
+
+* `memory_cache_info()`
+
+    Get the memory cache counters.
+
+* class: `NflDataPySource`, `MirrorSource`
+
+    Sources fetching from `nfl_data_py` or a local mirror of nflverse release files.
+
+* class: `LocalStore`, `MemoryStore`, `FsspecStore`
+
+    Stores for `set_shared_store()`.
+
 * class: `PlayerMap`
 
     Player ID mapping class.
 """
 
-from .nfldata import set_cache_path, load
-from .playermap import PlayerMap
+import importlib
+
+
+# Attributes are imported from their modules on first access (PEP 562), so
+# `import foopy.nfldata` stays fast and pandas, pyarrow and `nfl_data_py` are
+# only imported once they are needed.
+
+LAZY_ATTRIBUTES = {
+    "set_cache_path": ".nfldata",
+    "set_cache_format": ".nfldata",
+    "set_cache_budget": ".nfldata",
+    "set_source": ".nfldata",
+    "set_shared_store": ".nfldata",
+    "load": ".nfldata",
+    "load_iter": ".nfldata",
+    "load_async": ".nfldata",
+    "load_many_async": ".nfldata",
+    "prefetch": ".nfldata",
+    "cache_info": ".nfldata",
+    "prune_cache": ".nfldata",
+    "id_dictionary": ".nfldata",
+    "team_dtype": ".nfldata",
+    "pin_cache": ".nfldata",
+    "set_memory_cache": ".nfldata",
+    "memory_cache_info": ".nfldata",
+    "Source": ".sources",
+    "NflDataPySource": ".sources",
+    "MirrorSource": ".sources",
+    "Store": ".stores",
+    "LocalStore": ".stores",
+    "MemoryStore": ".stores",
+    "FsspecStore": ".stores",
+    "PlayerMap": ".playermap",
+}
+__all__ = list(LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
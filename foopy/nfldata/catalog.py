@@ -0,0 +1,399 @@
+import sqlite3
+import contextlib
+import os
+import time
+import hashlib
+import pyarrow
+import pyarrow.ipc
+import pandas
+
+
+# ===============
+# Catalog Entries
+# ===============
+
+
+def schema_hash(schema: pyarrow.Schema) -> str:
+    """
+    Hash of the column names and types of `schema`, ignoring metadata.
+    """
+    text = schema.to_string(show_field_metadata=False, show_schema_metadata=False)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def content_hash(table: pyarrow.Table) -> str:
+    """
+    Hash of the column names, types and values of `table`, ignoring metadata, chunking and how dictionary columns are encoded.
+    """
+    for index, field in enumerate(table.schema):
+        if pyarrow.types.is_dictionary(field.type):
+            column = table.column(index).cast(field.type.value_type)
+            table = table.set_column(index, field.with_type(column.type), column)
+    table = table.replace_schema_metadata(None).combine_chunks()
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return hashlib.sha256(sink.getvalue()).hexdigest()[:16]
+
+
+def create_entry(
+    data_name: str,
+    season: int | None,
+    week: int | None,
+    path: str,
+    schema: pyarrow.Schema,
+    rows: int,
+    transform_version: int,
+    cache_format: str,
+    content_hash: str | None = None,
+    compression_level: int | None = None,
+    source: str | None = None,
+) -> dict:
+    """
+    Create the catalog entry for the cached file at `path`. `transform_version` is the version of the transforms applied to the cached data, `0` if it is untransformed. `cache_format` is the file format of `path`. `content_hash` is the `content_hash()` of the data in `path`, if known. `compression_level` is the zstd level `path` was recompressed at, if any. `source` is the name of the source the data was fetched from, if known.
+    """
+    fetched_at = time.time()
+    return {
+        "data_name": data_name,
+        "season": season,
+        "week": week,
+        "path": path,
+        "rows": rows,
+        "bytes": os.path.getsize(path),
+        "schema_hash": schema_hash(schema),
+        "fetched_at": fetched_at,
+        "transform_version": transform_version,
+        "format": cache_format,
+        "content_hash": content_hash,
+        "checked_at": fetched_at,
+        "accessed_at": None,
+        "compression_level": compression_level,
+        "source": source,
+    }
+
+
+# =============
+# Catalog Class
+# =============
+
+
+CATALOG_FNAME = "catalog.sqlite"
+CATALOG_TIMEOUT = 60.0
+ENTRY_COLUMNS = [
+    "data_name",
+    "season",
+    "week",
+    "path",
+    "rows",
+    "bytes",
+    "schema_hash",
+    "fetched_at",
+    "transform_version",
+    "format",
+    "content_hash",
+    "checked_at",
+    "accessed_at",
+    "compression_level",
+    "source",
+]
+
+
+ADDED_COLUMNS = {
+    "transform_version": "transform_version INTEGER NOT NULL DEFAULT 0",
+    "format": "format TEXT NOT NULL DEFAULT 'parquet'",
+    "content_hash": "content_hash TEXT",
+    "checked_at": "checked_at REAL",
+    "accessed_at": "accessed_at REAL",
+    "compression_level": "compression_level INTEGER",
+    "source": "source TEXT",
+}
+
+
+PINNED_COLUMN = (
+    "EXISTS (SELECT 1 FROM pins WHERE pins.data_name = partitions.data_name "
+    "AND pins.season IS partitions.season)"
+)
+
+
+class Catalog:
+    """
+    SQLite catalog of the partitions stored in a cache directory. Every write is a single transaction, so several threads or processes can share one cache.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, CATALOG_FNAME)
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS partitions (
+                    data_name TEXT NOT NULL,
+                    season INTEGER,
+                    week INTEGER,
+                    path TEXT NOT NULL PRIMARY KEY,
+                    rows INTEGER NOT NULL,
+                    bytes INTEGER NOT NULL,
+                    schema_hash TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    transform_version INTEGER NOT NULL DEFAULT 0,
+                    format TEXT NOT NULL DEFAULT 'parquet',
+                    content_hash TEXT,
+                    checked_at REAL,
+                    accessed_at REAL,
+                    compression_level INTEGER,
+                    source TEXT
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pins (
+                    data_name TEXT NOT NULL,
+                    season INTEGER
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ids (
+                    system TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    code INTEGER NOT NULL,
+                    PRIMARY KEY (system, id)
+                )
+                """
+            )
+            # Add any columns missing from catalogs created by older versions.
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(partitions)")]
+            for column, definition in ADDED_COLUMNS.items():
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE partitions ADD COLUMN {definition}")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS partitions_season "
+                "ON partitions (data_name, season)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=CATALOG_TIMEOUT)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(path, self.cache_dir)
+
+    # ===============
+    # Write Functions
+    # ===============
+
+    def replace(self, data_name: str, seasons: list[int | None], entries: list[dict]):
+        """
+        Atomically replace the entries of `seasons` for `data_name` with `entries`. A season of `None` is used for non-years data.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for season in seasons:
+                conn.execute(
+                    "DELETE FROM partitions WHERE data_name = ? AND season IS ?",
+                    (data_name, season),
+                )
+            conn.executemany(
+                f"INSERT OR REPLACE INTO partitions ({', '.join(ENTRY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in ENTRY_COLUMNS)})",
+                [
+                    tuple(
+                        self._relpath(entry[column])
+                        if column == "path"
+                        else entry[column]
+                        for column in ENTRY_COLUMNS
+                    )
+                    for entry in entries
+                ],
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def touch(self, data_name: str, seasons: list[int | None]):
+        """
+        Record that `seasons` of `data_name` were read now.
+        """
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "UPDATE partitions SET accessed_at = ? "
+                "WHERE data_name = ? AND season IS ?",
+                [(time.time(), data_name, season) for season in seasons],
+            )
+
+    def set_pinned(self, data_name: str, seasons: list[int | None], pinned: bool):
+        """
+        Pin or unpin `seasons` of `data_name`. Pins are kept whether or not the seasons are cached.
+        """
+        with contextlib.closing(self._connect()) as conn, conn:
+            for season in seasons:
+                conn.execute(
+                    "DELETE FROM pins WHERE data_name = ? AND season IS ?",
+                    (data_name, season),
+                )
+                if pinned:
+                    conn.execute(
+                        "INSERT INTO pins (data_name, season) VALUES (?, ?)",
+                        (data_name, season),
+                    )
+
+    # ==============
+    # Read Functions
+    # ==============
+
+    def seasons(self, data_name: str) -> set[int]:
+        """
+        Get the cached seasons for `data_name`.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT season FROM partitions "
+                "WHERE data_name = ? AND season IS NOT NULL",
+                (data_name,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def stale_seasons(
+        self, data_name: str, transform_version: int, cache_format: str
+    ) -> set[int | None]:
+        """
+        Get the cached seasons for `data_name` with any file not at `transform_version` or not in `cache_format`. A season of `None` is used for non-years data.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT season FROM partitions "
+                "WHERE data_name = ? AND (transform_version != ? OR format != ?)",
+                (data_name, transform_version, cache_format),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def sources(self, data_name: str) -> dict[int | None, str]:
+        """
+        Get the name of the source each cached season of `data_name` was fetched from. Seasons cached before sources were recorded are left out.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT season, source FROM partitions "
+                "WHERE data_name = ? AND source IS NOT NULL",
+                (data_name,),
+            ).fetchall()
+        return dict(rows)
+
+    def season_entries(self, data_name: str, season: int | None) -> list[dict]:
+        """
+        Get the entries of `season` for `data_name`, with paths relative to the cache directory. A season of `None` is used for non-years data.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(ENTRY_COLUMNS)} FROM partitions "
+                "WHERE data_name = ? AND season IS ? ORDER BY week, path",
+                (data_name, season),
+            ).fetchall()
+        return [dict(zip(ENTRY_COLUMNS, row)) for row in rows]
+
+    def contains(self, data_name: str) -> bool:
+        """
+        Whether or not any data for `data_name` is cached.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM partitions WHERE data_name = ? LIMIT 1", (data_name,)
+            ).fetchone()
+        return row is not None
+
+    def entries(self, data_name: str | None = None) -> pandas.DataFrame:
+        """
+        Get the catalog entries, optionally only those for `data_name`, with whether or not the season of each entry is pinned.
+        """
+        query = f"SELECT {', '.join(ENTRY_COLUMNS)}, {PINNED_COLUMN} FROM partitions"
+        params = ()
+        if data_name is not None:
+            query += " WHERE data_name = ?"
+            params = (data_name,)
+        query += " ORDER BY data_name, season, week, path"
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+        df = pandas.DataFrame(rows, columns=ENTRY_COLUMNS + ["pinned"])
+        df["pinned"] = df["pinned"].astype(bool)
+        return df
+
+    def total_bytes(self) -> int:
+        """
+        Get the total size of the cached files.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            row = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM partitions")
+            return row.fetchone()[0]
+
+    def season_usage(self) -> list[dict]:
+        """
+        Get the size, last use, pin and compression of each cached season, least recently used first. A season is last used when it was last read, or fetched if it has never been read.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT data_name, season, SUM(bytes), "
+                "MAX(COALESCE(accessed_at, fetched_at)) AS used_at, "
+                f"MAX({PINNED_COLUMN}), MIN(COALESCE(compression_level, 0)), "
+                "MAX(format != 'parquet') "
+                "FROM partitions GROUP BY data_name, season ORDER BY used_at"
+            ).fetchall()
+        columns = ["data_name", "season", "bytes", "used_at", "pinned"]
+        columns += ["compression_level", "uncompressible"]
+        return [dict(zip(columns, row)) for row in rows]
+
+    # ===============
+    # ID Dictionaries
+    # ===============
+
+    # Each ID system (e.g. `gsis_id`) has a dictionary assigning every ID seen
+    # in it a code. Codes are 0, 1, 2, ... in the order IDs were first seen and
+    # never change.
+
+    def intern_ids(self, system: str, ids: list[str]):
+        """
+        Assign codes to the `ids` of `system` that don't have one yet.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("SELECT id FROM ids WHERE system = ?", (system,))
+            existing = {row[0] for row in rows}
+            new_ids = [id for id in dict.fromkeys(ids) if id not in existing]
+            conn.executemany(
+                "INSERT INTO ids (system, id, code) VALUES (?, ?, ?)",
+                [
+                    (system, id, code)
+                    for code, id in enumerate(new_ids, start=len(existing))
+                ],
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def id_count(self, system: str) -> int:
+        """
+        Get the number of IDs of `system` that have codes.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            row = conn.execute("SELECT COUNT(*) FROM ids WHERE system = ?", (system,))
+            return row.fetchone()[0]
+
+    def id_dictionary(self, system: str) -> list[str]:
+        """
+        Get the IDs of `system` in code order, so that the code of an ID is its index.
+        """
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT id FROM ids WHERE system = ? ORDER BY code", (system,)
+            ).fetchall()
+        return [row[0] for row in rows]
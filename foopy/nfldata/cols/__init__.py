@@ -8,6 +8,7 @@ Modules
 
 * draft
 * pbp
+* pbp_types
 * player
 * roster
 * schedule
@@ -21,4 +22,20 @@ cols.draft.RushAtts.header
 ```
 """
 
-from . import draft, pbp, player, roster, schedule, map
+import importlib
+
+
+# Each column module defines hundreds of classes, so modules are only imported
+# when first accessed (PEP 562).
+
+MODULES = ["draft", "pbp", "player", "roster", "schedule", "map", "pbp_types"]
+
+
+def __getattr__(name: str):
+    if name not in MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module("." + name, __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + MODULES)
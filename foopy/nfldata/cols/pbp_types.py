@@ -0,0 +1,220 @@
+"""
+Compact column types for `pbp` data, used when caching it.
+
+* `int8` / `int16` for 0/1 indicators and small integer counts.
+* `category` for team and other low-cardinality string columns, stored as a dictionary column.
+* Any other `float64` column not listed here is stored as `float32`, except the ID columns, if `float32` holds all of its values exactly.
+"""
+
+INDICATOR_COLUMNS = [
+    "aborted_play",
+    "assist_tackle",
+    "complete_pass",
+    "defensive_extra_point_attempt",
+    "defensive_extra_point_conv",
+    "defensive_two_point_attempt",
+    "defensive_two_point_conv",
+    "div_game",
+    "drive_ended_with_score",
+    "drive_inside20",
+    "extra_point_attempt",
+    "field_goal_attempt",
+    "first_down",
+    "first_down_pass",
+    "first_down_penalty",
+    "first_down_rush",
+    "fourth_down_converted",
+    "fourth_down_failed",
+    "fumble",
+    "fumble_forced",
+    "fumble_lost",
+    "fumble_not_forced",
+    "fumble_out_of_bounds",
+    "goal_to_go",
+    "home_opening_kickoff",
+    "incomplete_pass",
+    "interception",
+    "kickoff_attempt",
+    "kickoff_downed",
+    "kickoff_fair_catch",
+    "kickoff_in_endzone",
+    "kickoff_inside_twenty",
+    "kickoff_out_of_bounds",
+    "lateral_reception",
+    "lateral_recovery",
+    "lateral_return",
+    "lateral_rush",
+    "no_huddle",
+    "out_of_bounds",
+    "own_kickoff_recovery",
+    "own_kickoff_recovery_td",
+    "pass",
+    "pass_attempt",
+    "pass_touchdown",
+    "penalty",
+    "play",
+    "play_deleted",
+    "punt_attempt",
+    "punt_blocked",
+    "punt_downed",
+    "punt_fair_catch",
+    "punt_in_endzone",
+    "punt_inside_twenty",
+    "punt_out_of_bounds",
+    "qb_dropback",
+    "qb_hit",
+    "qb_kneel",
+    "qb_scramble",
+    "qb_spike",
+    "quarter_end",
+    "replay_or_challenge",
+    "return_touchdown",
+    "rush",
+    "rush_attempt",
+    "rush_touchdown",
+    "sack",
+    "safety",
+    "series_success",
+    "shotgun",
+    "solo_tackle",
+    "sp",
+    "special",
+    "special_teams_play",
+    "success",
+    "tackle_with_assist",
+    "tackled_for_loss",
+    "third_down_converted",
+    "third_down_failed",
+    "timeout",
+    "touchback",
+    "touchdown",
+    "two_point_attempt",
+    "was_pressure",
+]
+
+INT8_COLUMNS = [
+    "away_timeouts_remaining",
+    "defenders_in_box",
+    "defteam_timeouts_remaining",
+    "down",
+    "drive_first_downs",
+    "drive_play_count",
+    "drive_quarter_end",
+    "drive_quarter_start",
+    "home_timeouts_remaining",
+    "jersey_number",
+    "n_defense",
+    "n_offense",
+    "number_of_pass_rushers",
+    "passer_jersey_number",
+    "posteam_timeouts_remaining",
+    "qtr",
+    "receiver_jersey_number",
+    "rusher_jersey_number",
+    "week",
+    "ydstogo",
+    "yardline_100",
+]
+
+INT16_COLUMNS = [
+    "air_yards",
+    "away_score",
+    "defteam_score",
+    "defteam_score_post",
+    "drive",
+    "drive_yards_penalized",
+    "fixed_drive",
+    "fumble_recovery_1_yards",
+    "fumble_recovery_2_yards",
+    "game_seconds_remaining",
+    "half_seconds_remaining",
+    "home_score",
+    "kick_distance",
+    "lateral_receiving_yards",
+    "lateral_rushing_yards",
+    "passing_yards",
+    "penalty_yards",
+    "posteam_score",
+    "posteam_score_post",
+    "quarter_seconds_remaining",
+    "receiving_yards",
+    "result",
+    "return_yards",
+    "rushing_yards",
+    "score_differential",
+    "score_differential_post",
+    "season",
+    "series",
+    "temp",
+    "total",
+    "total_away_score",
+    "total_home_score",
+    "wind",
+    "yards_after_catch",
+    "yards_gained",
+    "ydsnet",
+]
+
+CATEGORY_COLUMNS = [
+    "assist_tackle_1_team",
+    "assist_tackle_2_team",
+    "assist_tackle_3_team",
+    "assist_tackle_4_team",
+    "away_coach",
+    "away_team",
+    "defense_coverage_type",
+    "defense_man_zone_type",
+    "defteam",
+    "drive_end_transition",
+    "drive_start_transition",
+    "extra_point_result",
+    "field_goal_result",
+    "fixed_drive_result",
+    "forced_fumble_player_1_team",
+    "forced_fumble_player_2_team",
+    "fumble_recovery_1_team",
+    "fumble_recovery_2_team",
+    "fumbled_1_team",
+    "fumbled_2_team",
+    "game_half",
+    "game_stadium",
+    "home_coach",
+    "home_team",
+    "location",
+    "offense_formation",
+    "pass_length",
+    "pass_location",
+    "penalty_team",
+    "penalty_type",
+    "play_type",
+    "play_type_nfl",
+    "possession_team",
+    "posteam",
+    "posteam_type",
+    "replay_or_challenge_result",
+    "return_team",
+    "roof",
+    "route",
+    "run_gap",
+    "run_location",
+    "season_type",
+    "series_result",
+    "side_of_field",
+    "solo_tackle_1_team",
+    "solo_tackle_2_team",
+    "st_play_type",
+    "stadium",
+    "surface",
+    "tackle_with_assist_1_team",
+    "tackle_with_assist_2_team",
+    "td_team",
+    "timeout_team",
+    "two_point_conv_result",
+]
+
+PBP_TYPES = {
+    **{column: "int8" for column in INDICATOR_COLUMNS + INT8_COLUMNS},
+    **{column: "int16" for column in INT16_COLUMNS},
+    **{column: "category" for column in CATEGORY_COLUMNS},
+}
+DEFAULT_FLOAT_TYPE = "float32"
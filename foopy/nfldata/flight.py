@@ -0,0 +1,110 @@
+import concurrent.futures
+import threading
+import typing
+import os
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+# =============
+# Single Flight
+# =============
+
+
+class SingleFlight:
+    """
+    Run a function at most once at a time per key. Callers asking for a key that is already in flight wait for and share the result of the running call.
+    """
+
+    def __init__(self):
+        self.futures = {}
+        self.lock = threading.Lock()
+
+    def do(self, key: typing.Hashable, func: typing.Callable[[], typing.Any]):
+        """
+        Call `func` under `key`, or wait for the call already running under `key`. Exceptions raised by `func` are raised to every caller.
+        """
+        with self.lock:
+            future = self.futures.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self.futures[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.futures[key]
+
+    def in_flight(self) -> int:
+        """
+        Get the number of keys currently in flight.
+        """
+        with self.lock:
+            return len(self.futures)
+
+
+# =========
+# File Lock
+# =========
+
+
+def _lock_file(file: typing.IO):
+    if os.name == "nt":
+        file.seek(0)
+        while True:
+            try:
+                # Blocks for up to 10 seconds before raising.
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(file: typing.IO):
+    if os.name == "nt":
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class FileLock:
+    """
+    Exclusive lock on the file at `path`, shared by every process and thread that uses the same `path`. Blocks until the lock is acquired. Not reentrant.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def __enter__(self) -> "FileLock":
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        file = open(self.path, "a+")
+        try:
+            _lock_file(file)
+        except BaseException:
+            file.close()
+            raise
+        self.file = file
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            _unlock_file(self.file)
+        finally:
+            self.file.close()
+            self.file = None
@@ -1,3 +1,4 @@
+import numpy
 import pandas
 import os
 import tqdm
@@ -11,6 +12,7 @@ class IDMap:
     def __init__(self):
         self.df = pandas.DataFrame()
         self.append_df = pandas.DataFrame()
+        self.conflicts = pandas.DataFrame()
 
     # ============
     # IO Functions
@@ -47,7 +49,7 @@ class IDMap:
     # Data Manipulation Functions
     # ===========================
 
-    def append(self, new_maps: pandas.DataFrame, pbar: tqdm.tqdm):
+    def append(self, new_maps: pandas.DataFrame, pbar: tqdm.tqdm | None = None):
         """
         Append a `DataFrame` of new maps to the `IDMap`.
 
@@ -56,18 +58,21 @@ class IDMap:
 
         new_maps : DataFrame
             New maps to append.
+
+        pbar : tqdm | None = None
+            Progress bar to update after each step.
         """
-        self.append_df = pandas.concat([self.append_df, new_maps])
-        pbar.update()
-        dupes_mask = self.append_df.duplicated(keep=False)
-        pbar.update()
-        dupes = self.append_df[dupes_mask]
-        pbar.update()
-        dupes = dupes.drop_duplicates()
+        if pbar is None:
+            pbar = tqdm.tqdm(disable=True)
+        appended = len(self.append_df.index)
+        combined = pandas.concat([self.append_df, new_maps])
         pbar.update()
-        self.append_df = self.append_df.drop_duplicates().reset_index(drop=True)
+        # Rows already appended, or repeated within `new_maps`, are not new.
+        seen = combined.duplicated().to_numpy()
         pbar.update()
-        new_maps = pandas.concat([new_maps, dupes]).drop_duplicates(keep=False)
+        new_maps = combined.iloc[appended:][~seen[appended:]]
+        pbar.update(3)
+        self.append_df = combined[~seen].reset_index(drop=True)
         pbar.update()
         self.df = pandas.concat([self.df, new_maps]).reset_index(drop=True)
         pbar.update()
@@ -76,53 +81,96 @@ class IDMap:
     # Maptize Functions
     # =================
 
-    def _get_column_dupes_df(self, column: str) -> pandas.DataFrame:
-        """
-        Get the DataFrame containing all rows with values for `column` that are duplicated.
-        """
-        series = self.df[column]
-        all_dupes = series.duplicated(keep=False) & series.notna()
-        return self.df[all_dupes]
+    # Rows are merged column by column, in the order of `map_columns`: the rows
+    # sharing a value of the column are merged into one row if they agree on
+    # every other column, and left apart otherwise. Passes over the columns are
+    # repeated until no rows merge, since a merge can let rows merge by an
+    # earlier column. Each pass works on whole arrays of factorized codes.
 
-    def _get_id_value_df(
-        self, dupes_df: pandas.DataFrame, column: str, id_value: str
-    ) -> pandas.DataFrame:
-        """
-        Get the DataFrame with all rows where `column == id_value`. Returns an empty DataFrame if all IDs are not matching.
+    def _merge_column(
+        self, values: numpy.ndarray, alive: numpy.ndarray, column: int
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
         """
-        id_value_df = dupes_df[dupes_df[column] == id_value]
-        if all((id_value_df.nunique() == 1) | (id_value_df.nunique() == 0)):
-            return id_value_df
-        else:
-            return pandas.DataFrame()
+        Merge the rows of `values`, factorized codes with -1 for missing values, that share a code in `column` and agree on every other column. Rows that are not `alive` have been merged into another row. Merged rows are updated in place.
 
-    def _maptize_by_column(self, column: str, number: int, total: int):
-        """
-        Maptize a single column given by `column`.
+        Returns
+        -------
+
+        out : tuple[ndarray, ndarray]
+            Row each row is merged into, itself if it is not merged, and the sorted codes of `column` shared by rows that don't agree.
         """
-        dupes_df = self._get_column_dupes_df(column)
-        for id_value in tqdm.tqdm(
-            dupes_df[column].unique(), desc=f"Maptizing {number} / {total}"
-        ):
-            id_value_df = self._get_id_value_df(dupes_df, column, id_value)
-            if not id_value_df.empty:
-                new_series = pandas.Series(
-                    {column: None for column in id_value_df.columns}
-                )
-                for _, series in id_value_df.iterrows():
-                    new_series = new_series.combine_first(series)
-                for index in id_value_df.index:
-                    self.df.loc[index] = new_series
-        self.df = self.df.drop_duplicates()
+        rows = numpy.flatnonzero(alive & (values[:, column] >= 0))
+        keys = values[rows, column]
+        target = numpy.arange(len(values))
+        # Only rows sharing their code with another row can merge.
+        shared = numpy.bincount(keys)[keys] > 1
+        rows = rows[shared]
+        order = numpy.argsort(keys[shared], kind="stable")
+        rows = rows[order]
+        keys = keys[shared][order]
+        if len(rows) == 0:
+            return target, keys
+        starts = numpy.flatnonzero(numpy.diff(keys, prepend=-1))
+        # Smallest and largest code of each column among the rows of each key.
+        row_values = values[rows]
+        missing = row_values < 0
+        low = numpy.minimum.reduceat(
+            numpy.where(missing, numpy.iinfo(values.dtype).max, row_values), starts
+        )
+        high = numpy.maximum.reduceat(row_values, starts)
+        conflicted = ((high >= 0) & (low != high)).any(axis=1)
+        sizes = numpy.diff(starts, append=len(rows))
+        merge = numpy.repeat(~conflicted, sizes)
+        target[rows[merge]] = numpy.repeat(rows[starts], sizes)[merge]
+        values[rows[starts][~conflicted]] = high[~conflicted]
+        return target, keys[starts][conflicted]
 
     def maptize(self, map_columns: list[str]):
         """
-        Maptize the `IDMap`.
+        Maptize the `IDMap`, merging the rows linked by the IDs in `map_columns` into one row per player. Rows sharing an ID are only merged if they agree on every column. The rows sharing each such ambiguous ID are recorded in `conflicts`, with the column of the ID in `conflict_column` and a number for each ambiguous ID in `conflict`.
         """
-        count = 1
-        for column in map_columns:
-            self._maptize_by_column(column, count, len(map_columns))
-            count += 1
+        df = self.df.drop_duplicates().reset_index(drop=True)
+        factorized = [pandas.factorize(df[column]) for column in df.columns]
+        values = numpy.zeros((len(df.index), len(df.columns)), dtype=numpy.int64)
+        for index, (codes, _) in enumerate(factorized):
+            values[:, index] = codes
+        alive = numpy.ones(len(df.index), dtype=bool)
+        columns = [df.columns.get_loc(column) for column in map_columns if column in df]
+        changed = True
+        while changed:
+            changed = False
+            conflicts = []
+            for column in columns:
+                target, conflicted = self._merge_column(values, alive, column)
+                merged_away = target != numpy.arange(len(target))
+                changed = changed or bool(merged_away.any())
+                alive &= ~merged_away
+                conflicts.append((column, conflicted))
+        merged = pandas.DataFrame(
+            {
+                column: pandas.api.extensions.take(
+                    uniques.to_numpy(), values[alive, index], allow_fill=True
+                )
+                for index, (column, (_, uniques)) in enumerate(
+                    zip(df.columns, factorized)
+                )
+            },
+            columns=df.columns,
+        )
+        frames = [merged.iloc[:0].assign(conflict_column=None, conflict=None)]
+        count = 0
+        for column, codes in conflicts:
+            keys = values[alive, column]
+            in_conflict = numpy.isin(keys, codes)
+            frames.append(
+                merged[in_conflict].assign(
+                    conflict_column=df.columns[column],
+                    conflict=count + numpy.searchsorted(codes, keys[in_conflict]),
+                )
+            )
+            count += len(codes)
+        self.conflicts = pandas.concat(frames, ignore_index=True)
+        self.df = merged
 
     # =============
     # Magic Methods
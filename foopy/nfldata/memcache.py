@@ -0,0 +1,144 @@
+import collections
+import threading
+import numpy
+import pandas
+import pyarrow
+
+
+# ============
+# Key Creation
+# ============
+
+
+def freeze(value):
+    """
+    Convert `value` into a hashable equivalent (lists to tuples, sets to frozensets).
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    else:
+        return value
+
+
+def frame_bytes(frame: pandas.DataFrame | pyarrow.Table) -> int:
+    """
+    Get the memory used by `frame`.
+    """
+    if isinstance(frame, pyarrow.Table):
+        return frame.nbytes
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+def freeze_frame(frame: pandas.DataFrame):
+    """
+    Make the values of `frame` read-only, so that writing to them in place raises `ValueError`. Columns can still be added to, replaced in or dropped from `frame` itself.
+    """
+    # pandas has no public way to make a frame read-only, so the arrays backing
+    # its columns are marked read-only directly.
+    for array in frame._mgr.arrays:
+        buffers = [array]
+        if not isinstance(array, numpy.ndarray):
+            buffers = [
+                getattr(array, name, None) for name in ("_ndarray", "_data", "_mask")
+            ]
+        for buffer in buffers:
+            if isinstance(buffer, numpy.ndarray):
+                buffer.flags.writeable = False
+
+
+# ===================
+# DataFrame LRU Cache
+# ===================
+
+
+class FrameCache:
+    """
+    In-memory LRU cache of DataFrames, bounded by the total bytes of the cached frames. Cached DataFrames are made read-only (see `freeze_frame()`). `pyarrow.Table` frames are immutable and are never copied.
+    """
+
+    def __init__(self, max_bytes: int = 0, copy: bool = True):
+        """
+        Parameters
+        ----------
+
+        max_bytes : int = 0
+            Memory budget in bytes. `0` disables the cache.
+
+        copy : bool = True
+            Whether or not to return copies of cached frames. If `False` the cached frame itself is returned; writing to its values in place raises `ValueError`, and columns must not be added to or dropped from it.
+        """
+        self.max_bytes = max_bytes
+        self.copy = copy
+        self.frames = collections.OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple) -> pandas.DataFrame | pyarrow.Table | None:
+        """
+        Get the frame cached under `key`, or `None` if it is not cached.
+        """
+        with self.lock:
+            if key not in self.frames:
+                self.misses += 1
+                return None
+            self.frames.move_to_end(key)
+            self.hits += 1
+            df, _ = self.frames[key]
+        if self.copy and isinstance(df, pandas.DataFrame):
+            return df.copy()
+        return df
+
+    def put(self, key: tuple, df: pandas.DataFrame | pyarrow.Table):
+        """
+        Cache `df` under `key`, evicting the least recently used frames to stay within budget.
+        """
+        if self.max_bytes <= 0:
+            return
+        nbytes = frame_bytes(df)
+        if nbytes > self.max_bytes:
+            return
+        if isinstance(df, pandas.DataFrame):
+            if self.copy:
+                df = df.copy()
+            freeze_frame(df)
+        with self.lock:
+            if key in self.frames:
+                self.bytes -= self.frames.pop(key)[1]
+            self.frames[key] = (df, nbytes)
+            self.bytes += nbytes
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self.frames.popitem(last=False)
+                self.bytes -= evicted_bytes
+                self.evictions += 1
+
+    def invalidate(self, data_name: str):
+        """
+        Remove every cached frame whose key starts with `data_name`.
+        """
+        with self.lock:
+            for key in [key for key in self.frames if key[0] == data_name]:
+                self.bytes -= self.frames.pop(key)[1]
+
+    def clear(self):
+        with self.lock:
+            self.frames.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the hit, miss and eviction counters and current usage.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.frames),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
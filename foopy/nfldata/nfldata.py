@@ -1,10 +1,33 @@
-import nfl_data_py
 import typing
 import pandas
+import pyarrow
+import pyarrow.compute
+import pyarrow.dataset
+import pyarrow.fs
+import pyarrow.ipc
+import pyarrow.parquet
 import json
 import os
 from . import cols
+from . import catalog
+from . import memcache
+from . import flight
+from . import sources
+from . import stores
 import copy
+import concurrent.futures
+import time
+import functools
+import operator
+import asyncio
+import threading
+import shutil
+import collections
+import contextlib
+import weakref
+
+if typing.TYPE_CHECKING:
+    import polars
 
 
 FIRST_SEASON = 2002
@@ -13,14 +36,16 @@ FIRST_SEASON = 2002
 DATA_NAMES = typing.Literal["pbp", "draft", "roster", "player", "schedule", "map"]
 DATA_NAMES_VALUES = {"pbp", "draft", "roster", "player", "schedule", "map"}
 YEARS_DATA_NAMES = {"pbp", "draft", "roster", "schedule"}
-NFL_DATA_FUNCS = {
-    "pbp": nfl_data_py.import_pbp_data,
-    "draft": nfl_data_py.import_draft_picks,
-    "roster": nfl_data_py.import_weekly_rosters,
-    "player": nfl_data_py.import_players,
-    "schedule": nfl_data_py.import_schedules,
-    "map": nfl_data_py.import_ids,
-}
+BACKENDS = typing.Literal["pandas", "arrow", "polars"]
+BACKEND_VALUES = {"pandas", "arrow", "polars"}
+ID_ENCODINGS = typing.Literal["str", "int", "dictionary"]
+ID_ENCODING_VALUES = {"str", "int", "dictionary"}
+CACHE_FORMATS = typing.Literal["parquet", "arrow-ipc"]
+CACHE_FORMAT_VALUES = {"parquet", "arrow-ipc"}
+# Names of the `nfl_data_py` functions used by the default source, imported the
+# first time data is fetched. Values may also be the functions.
+NFL_DATA_FUNCS = dict(sources.NFL_DATA_PY_FUNCS)
+
 
 # =======================
 # Configuration Functions
@@ -71,82 +96,889 @@ def set_cache_path(path: str):
         raise ValueError("Path must be a string.")
 
 
+def set_cache_format(cache_format: CACHE_FORMATS):
+    """
+    Set the file format used for cached data. Saved in the configuration file. Data cached in another format is rewritten in this format the next time it is loaded.
+
+    Parameters
+    ----------
+
+    cache_format : {"parquet", "arrow-ipc"}
+        `parquet` files are compressed and smallest on disk. `arrow-ipc` (Feather v2) files are uncompressed and memory-mapped when read, so warm loads skip decoding and several processes can share the same pages of a hot file.
+    """
+    if cache_format in CACHE_FORMAT_VALUES:
+        CONFIG_DATA["cache_format"] = cache_format
+        _dump_config_data()
+    else:
+        raise ValueError(f'Cache format "{cache_format}" invalid.')
+
+
+def _cache_format() -> CACHE_FORMATS:
+    return CONFIG_DATA.get("cache_format", "parquet")
+
+
+def set_cache_budget(max_bytes: int | None, recompress_level: int | None = None):
+    """
+    Set the disk budget for the cache directory. Saved in the configuration file. Whenever data added to the cache takes it over budget, parquet files of past seasons are first recompressed at `recompress_level`, then the least recently used seasons that are not pinned (see `pin_cache()`) are evicted until the cache fits.
+
+    Parameters
+    ----------
+
+    max_bytes : int | None
+        Disk budget in bytes. `None` lets the cache grow without bound.
+
+    recompress_level : int | None = None
+        zstd compression level (1 - 22) to recompress past seasons at before any season is evicted. The latest cached season of each dataset is never recompressed. `None` never recompresses.
+    """
+    if max_bytes is not None and (
+        not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes < 0
+    ):
+        raise ValueError("max_bytes must be a non-negative integer or None.")
+    if recompress_level is not None and (
+        not isinstance(recompress_level, int)
+        or isinstance(recompress_level, bool)
+        or not 1 <= recompress_level <= 22
+    ):
+        raise ValueError("recompress_level must be an integer from 1 to 22 or None.")
+    CONFIG_DATA["cache_max_bytes"] = max_bytes
+    CONFIG_DATA["cache_recompress_level"] = recompress_level
+    _dump_config_data()
+
+
+# ================
+# Source Functions
+# ================
+
+# Data that is not cached yet is fetched from `SOURCE`, `nfl_data_py` unless
+# `set_source()` is called.
+
+
+SOURCE = sources.NflDataPySource(NFL_DATA_FUNCS)
+
+
+def set_source(source: sources.Source | None):
+    """
+    Set where data that is not cached yet is fetched from, for this process.
+
+    Parameters
+    ----------
+
+    source : Source | None
+        e.g. `MirrorSource("/data/nflverse")` to fill the cache from a local mirror of nflverse release files without network access. `None` restores the default `NflDataPySource`.
+    """
+    if source is None:
+        source = sources.NflDataPySource(NFL_DATA_FUNCS)
+    elif not isinstance(source, sources.Source):
+        raise ValueError("source must be a Source.")
+    global SOURCE
+    SOURCE = source
+
+
+# ======================
+# Memory Cache Functions
+# ======================
+
+# Frames returned by load() can be kept in memory so that repeated loads skip
+# the cache directory entirely. Disabled until `set_memory_cache()` is called.
+
+
+FRAME_CACHE = memcache.FrameCache()
+
+
+def set_memory_cache(max_bytes: int, copy: bool = True):
+    """
+    Set the memory budget for frames kept in memory by `load()`. Frames are evicted least recently used first.
+
+    Parameters
+    ----------
+
+    max_bytes : int
+        Memory budget in bytes. `0` disables the memory cache.
+
+    copy : bool = True
+        Whether or not `load()` returns copies of frames in memory. If `False` the frames are shared between callers and are read-only: writing to their values in place raises `ValueError`. Columns must not be added to or dropped from them either, which is not prevented.
+    """
+    if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes < 0:
+        raise ValueError("max_bytes must be a non-negative integer.")
+    if not isinstance(copy, bool):
+        raise ValueError("copy must be a bool.")
+    global FRAME_CACHE
+    FRAME_CACHE = memcache.FrameCache(max_bytes, copy)
+
+
+def memory_cache_info() -> dict[str, int]:
+    """
+    Get the hit, miss and eviction counters and usage of the memory cache.
+    """
+    return FRAME_CACHE.stats()
+
+
 # =================
 # Caching Functions
 # =================
 
 
-def _load_cached(fname: str) -> pandas.DataFrame:
-    path = os.path.join(CONFIG_DATA["cache_dir"], fname + ".parq")
-    df = pandas.read_parquet(path)
-    return df
+# Years data is cached as a hive-partitioned dataset per `data_name`, e.g.
+#
+#   pbp/season=2019/week=7/part-0.parquet
+#   draft/season=2019/part-0.parquet
+#
+# Non-years data is cached as a single `<data_name>.parq` file. With the
+# `arrow-ipc` cache format the files end in `.arrow` instead.
 
 
-def _dump_cached(df: pandas.DataFrame, fname: str):
-    path = os.path.join(CONFIG_DATA["cache_dir"], fname + ".parq")
-    df.to_parquet(path)
+PARTITION_COLUMNS = {
+    "pbp": ["season", "week"],
+    "roster": ["season", "week"],
+    "schedule": ["season", "week"],
+    "draft": ["season"],
+}
+HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+PART_FNAME = "part-0"
+PART_EXTENSIONS = {"parquet": ".parquet", "arrow-ipc": ".arrow"}
+NON_YEARS_EXTENSIONS = {"parquet": ".parq", "arrow-ipc": ".arrow"}
 
 
-# ==================
-# Metadata Functions
-# ==================
+def _file_format(path: str) -> CACHE_FORMATS:
+    if path.endswith(".arrow"):
+        return "arrow-ipc"
+    else:
+        return "parquet"
+
+
+def _read_schema(path: str) -> pyarrow.Schema:
+    if _file_format(path) == "arrow-ipc":
+        with pyarrow.memory_map(path) as source:
+            return pyarrow.ipc.open_file(source).schema
+    else:
+        return pyarrow.parquet.read_schema(path)
 
 
-def _load_metadata(data_name: DATA_NAMES) -> dict[int, bool] | bool:
+def _write_table(
+    table: pyarrow.Table,
+    path: str,
+    cache_format: CACHE_FORMATS,
+    compression_level: int | None = None,
+):
     """
-    Load metadata for the given `data_name` provided.
+    Write `table` to `path`. IPC files are left uncompressed so they can be read zero-copy from a memory map. Parquet files are compressed with zstd at `compression_level` if given. The table is written to a temporary file that is then renamed to `path`, so readers never see a partly written file.
+    """
+    temp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        if cache_format == "arrow-ipc":
+            with pyarrow.ipc.new_file(temp_path, table.schema) as writer:
+                writer.write_table(table)
+        elif compression_level is not None:
+            pyarrow.parquet.write_table(
+                table,
+                temp_path,
+                compression="zstd",
+                compression_level=compression_level,
+            )
+        else:
+            pyarrow.parquet.write_table(table, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _season_dir(data_name: DATA_NAMES, year: int) -> str:
+    return os.path.join(CONFIG_DATA["cache_dir"], data_name, f"season={year}")
+
+
+def _format_partition_value(value) -> str:
+    """
+    Format a partition value for use in a hive directory name.
+    """
+    if value is None:
+        return HIVE_NULL_PARTITION
+    elif isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    else:
+        return str(value)
+
+
+def _parse_partition_value(value: str):
+    if value == HIVE_NULL_PARTITION:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _split_partitions(
+    table: pyarrow.Table, columns: list[str]
+) -> list[tuple[str, pyarrow.Table]]:
+    """
+    Split `table` by the values of `columns`.
+
+    Returns
+    -------
+
+    out : list[tuple[str, pyarrow.Table]]
+        Relative hive directory and table for each partition.
+    """
+    if not columns or table.num_rows == 0:
+        return [("", table)]
+    column = columns[0]
+    parts = []
+    for value in pyarrow.compute.unique(table[column]).to_pylist():
+        if value is None:
+            mask = pyarrow.compute.is_null(table[column])
+        else:
+            mask = pyarrow.compute.equal(table[column], value)
+        dir_name = column + "=" + _format_partition_value(value)
+        for sub_dir, part in _split_partitions(table.filter(mask), columns[1:]):
+            parts.append((os.path.join(dir_name, sub_dir), part))
+    return parts
+
+
+def _partition_dictionaries(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    Re-encode the dictionary columns of `table`, a partition of a season, with only the values it holds, so that a partition doesn't change when values are added to the rest of its season.
+    """
+    for index, field in enumerate(table.schema):
+        if pyarrow.types.is_dictionary(field.type):
+            values = table.column(index).cast(field.type.value_type).combine_chunks()
+            column = pyarrow.compute.dictionary_encode(values).cast(field.type)
+            table = table.set_column(index, field, column)
+    return table
+
+
+def _partition_values(rel_dir: str) -> dict:
+    """
+    Get the partition values encoded in the hive directory `rel_dir`.
+    """
+    values = {}
+    for part in rel_dir.split(os.sep):
+        if "=" in part:
+            column, value = part.split("=", 1)
+            values[column] = _parse_partition_value(value)
+    return values
+
+
+def _partition_expression(rel_dir: str) -> pyarrow.dataset.Expression:
+    """
+    Create the filter expression satisfied by every row in the hive directory `rel_dir`.
+    """
+    expression = pyarrow.dataset.scalar(True)
+    for column, value in _partition_values(rel_dir).items():
+        if value is None:
+            expression = expression & pyarrow.dataset.field(column).is_null()
+        else:
+            expression = expression & (pyarrow.dataset.field(column) == value)
+    return expression
+
+
+def _season_fragments(data_name: DATA_NAMES, year: int) -> list[tuple[str, str]]:
+    """
+    Get the cached files for the season `year` of `data_name`.
+
+    Returns
+    -------
+
+    out : list[tuple[str, str]]
+        Path and relative hive directory of each file, in week order.
+    """
+    data_dir = os.path.join(CONFIG_DATA["cache_dir"], data_name)
+    fragments = []
+    for dir_path, _, fnames in os.walk(_season_dir(data_name, year)):
+        for fname in fnames:
+            if fname.endswith(tuple(PART_EXTENSIONS.values())):
+                rel_dir = os.path.relpath(dir_path, data_dir)
+                fragments.append((os.path.join(dir_path, fname), rel_dir))
+
+    def sort_key(fragment: tuple[str, str]):
+        values = _partition_values(fragment[1]).values()
+        return [
+            (value is None, value if isinstance(value, int) else 0) for value in values
+        ]
+
+    return sorted(fragments, key=sort_key)
+
+
+def _cached_fragments(
+    data_name: DATA_NAMES, years: list[int] | None
+) -> list[tuple[str, str]]:
+    """
+    Get the cached files for `years` of `data_name`, or the single file of non-years data if `years` is `None`.
+    """
+    if years is None:
+        for extension in NON_YEARS_EXTENSIONS.values():
+            path = os.path.join(CONFIG_DATA["cache_dir"], data_name + extension)
+            if os.path.exists(path):
+                return [(path, "")]
+        return []
+    fragments = []
+    for year in years:
+        fragments += _season_fragments(data_name, year)
+    return fragments
+
+
+def _cached_dataset(fragments: list[tuple[str, str]]) -> pyarrow.dataset.Dataset:
+    """
+    Create a dataset over the cached `fragments`, each a path and relative hive directory. IPC files are memory-mapped. Raises `pyarrow.ArrowInvalid` or `pyarrow.ArrowTypeError` if the seasons in `fragments` have incompatible schemas.
+    """
+    schemas = {}
+    for path, rel_dir in fragments:
+        season = _partition_values(rel_dir).get("season")
+        if season not in schemas:
+            schemas[season] = _read_schema(path)
+    schema = pyarrow.unify_schemas(list(schemas.values()), promote_options="permissive")
+    # A dataset has a single file format, so runs of files in the same format
+    # become child datasets of a union, keeping the files in order.
+    runs = []
+    for fragment in fragments:
+        if runs and _file_format(runs[-1][-1][0]) == _file_format(fragment[0]):
+            runs[-1].append(fragment)
+        else:
+            runs.append([fragment])
+    datasets = []
+    for run in runs:
+        if _file_format(run[0][0]) == "arrow-ipc":
+            file_format = pyarrow.dataset.IpcFileFormat()
+            filesystem = pyarrow.fs.LocalFileSystem(use_mmap=True)
+        else:
+            file_format = pyarrow.dataset.ParquetFileFormat()
+            filesystem = pyarrow.fs.LocalFileSystem()
+        datasets.append(
+            pyarrow.dataset.FileSystemDataset.from_paths(
+                [path for path, _ in run],
+                schema=schema,
+                format=file_format,
+                filesystem=filesystem,
+                partitions=[_partition_expression(rel_dir) for _, rel_dir in run],
+            )
+        )
+    if len(datasets) == 1:
+        return datasets[0]
+    return pyarrow.dataset.dataset(datasets)
+
+
+def _load_cached_table(
+    data_name: DATA_NAMES,
+    years: list[int] | None = None,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+) -> pyarrow.Table:
+    """
+    Load cached data for `data_name` as a `pyarrow.Table`. Years data is read as a single dataset scan over the partitions of `years`, with partitions that cannot match `filters` pruned by their directory. The table is chunked by cached file and its buffers are not copied. Compact columns are cast back to their original types unless `compact`. ID columns are encoded by `id_encoding`, and team columns are mapped to canonical abbreviations if `canonical_teams`.
+    """
+    fragments = _cached_fragments(data_name, years)
+    if not fragments:
+        return pyarrow.table({column: [] for column in columns or []})
+    dataset = _cached_dataset(fragments)
+    table = dataset.to_table(columns=columns, filter=_filter_expression(filters))
+    if not compact:
+        table = _restore_table(table)
+    table = _encode_IDs(data_name, table, id_encoding)
+    if canonical_teams:
+        table = _canonicalize_teams(data_name, table)
+    return table
+
+
+def _load_cached(
+    data_name: DATA_NAMES,
+    years: list[int] | None = None,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+) -> pandas.DataFrame:
+    """
+    Load cached data for `data_name` as a `pandas.DataFrame`.
+    """
+    try:
+        table = _load_cached_table(
+            data_name, years, columns, filters, compact, id_encoding, canonical_teams
+        )
+        return _table_to_pandas(table, compact)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        if years is None or len(years) <= 1:
+            raise
+    # Seasons with incompatible column types can't share one scan; read each
+    # season separately and let pandas reconcile the dtypes.
+    dfs = [
+        _load_cached(
+            data_name, [year], columns, filters, compact, id_encoding, canonical_teams
+        )
+        for year in years
+    ]
+    return pandas.concat(dfs, ignore_index=True)
+
+
+def _load_cached_lazy(
+    data_name: DATA_NAMES,
+    years: list[int] | None = None,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+) -> "polars.LazyFrame":
+    """
+    Load cached data for `data_name` as a `polars.LazyFrame`. Nothing is read until the frame is collected, and its seasons are not evicted while it is alive; projections and filters, including those added by the caller, are pushed down to the dataset scan. Compact columns are cast back to their original types unless `compact`. ID columns are encoded by `id_encoding` with the ID dictionaries, without reading any data. Team columns are mapped to canonical abbreviations if `canonical_teams`.
+    """
+    polars = _import_polars()
+    fragments = _cached_fragments(data_name, years)
+    if not fragments:
+        return polars.LazyFrame({column: [] for column in columns or []})
+    dataset = _cached_dataset(fragments)
+    # The files are only read when the frame is collected, so its seasons are
+    # not evicted while the frame, or any frame built on it, holds the dataset.
+    keys = _register_readers(data_name, [None] if years is None else years)
+    weakref.finalize(dataset, _release_readers, keys)
+    lazy = polars.scan_pyarrow_dataset(dataset)
+    if not compact:
+        casts = []
+        for field in dataset.schema:
+            original = _original_type(field)
+            if original is not None:
+                dtype = polars.from_arrow(pyarrow.array([], type=original)).dtype
+                casts.append(polars.col(field.name).cast(dtype))
+        if casts:
+            lazy = lazy.with_columns(casts)
+    if filters is not None:
+        lazy = lazy.filter(_polars_expression(polars, filters))
+    lazy = _encode_IDs_lazy(polars, data_name, lazy, dataset, id_encoding)
+    if canonical_teams:
+        lazy = _canonicalize_teams_lazy(polars, data_name, lazy, dataset.schema)
+    if columns is not None:
+        lazy = lazy.select(columns)
+    return lazy
+
+
+def _dump_cached(
+    df: pandas.DataFrame,
+    data_name: DATA_NAMES,
+    year: int | None = None,
+    transform_version: int | None = None,
+    previous: list[dict] | None = None,
+) -> list[dict]:
+    """
+    Dump `df` to the cache. Years data replaces the partitions of the season `year`. `transform_version` defaults to `TRANSFORM_VERSION`, i.e. `df` has been passed through `_transform()`, in which case its IDs are given codes (see `_intern_IDs()`).
+
+    `previous` are the catalog entries of the season `year` already cached. Partitions whose content is unchanged since then are not rewritten and keep their `fetched_at`, so refreshing a season only writes the weeks that changed.
+
+    Returns
+    -------
+
+    out : list[dict]
+        Catalog entries for the partitions of `df`.
+    """
+    if transform_version is None:
+        transform_version = TRANSFORM_VERSION
+    cache_format = _cache_format()
+    table = _compact_table(
+        data_name, pyarrow.Table.from_pandas(df, preserve_index=False)
+    )
+    if transform_version == TRANSFORM_VERSION:
+        _intern_IDs(data_name, table)
+    if year is None:
+        path = os.path.join(
+            CONFIG_DATA["cache_dir"], data_name + NON_YEARS_EXTENSIONS[cache_format]
+        )
+        _write_table(table, path, cache_format)
+        for extension in NON_YEARS_EXTENSIONS.values():
+            old_path = os.path.join(CONFIG_DATA["cache_dir"], data_name + extension)
+            if old_path != path and os.path.exists(old_path):
+                os.remove(old_path)
+        entry = catalog.create_entry(
+            data_name,
+            None,
+            None,
+            path,
+            table.schema,
+            table.num_rows,
+            transform_version,
+            cache_format,
+        )
+        return [entry]
+    season_dir = _season_dir(data_name, year)
+    previous = {entry["path"]: entry for entry in previous or []}
+    entries = []
+    for rel_dir, part in _split_partitions(table, PARTITION_COLUMNS[data_name][1:]):
+        part_dir = os.path.join(season_dir, rel_dir)
+        path = os.path.join(part_dir, PART_FNAME + PART_EXTENSIONS[cache_format])
+        part = _partition_dictionaries(part)
+        content_hash = catalog.content_hash(part)
+        entry = previous.get(os.path.relpath(path, CONFIG_DATA["cache_dir"]))
+        if (
+            entry is not None
+            and entry["content_hash"] == content_hash
+            and entry["transform_version"] == transform_version
+            and os.path.exists(path)
+        ):
+            entries.append(dict(entry, path=path, checked_at=time.time()))
+            continue
+        os.makedirs(part_dir, exist_ok=True)
+        _write_table(part, path, cache_format)
+        week = _partition_values(rel_dir).get("week")
+        entries.append(
+            catalog.create_entry(
+                data_name,
+                year,
+                week,
+                path,
+                part.schema,
+                part.num_rows,
+                transform_version,
+                cache_format,
+                content_hash,
+            )
+        )
+    # Remove the partitions that are no longer in the season, e.g. a week whose
+    # games were rescheduled, or files left in another cache format.
+    paths = {os.path.normpath(entry["path"]) for entry in entries}
+    for path, _ in _season_fragments(data_name, year):
+        if os.path.normpath(path) not in paths:
+            os.remove(path)
+            if not os.listdir(os.path.dirname(path)):
+                os.rmdir(os.path.dirname(path))
+    return entries
+
+
+def _migrate_flat_cache(data_name: DATA_NAMES):
+    """
+    Migrate any flat `<data_name>-<year>.parq` cache files to the partitioned layout.
+    """
+    cache_dir = CONFIG_DATA["cache_dir"]
+    if not os.path.isdir(cache_dir):
+        return
+    prefix = data_name + "-"
+    for fname in os.listdir(cache_dir):
+        year = fname[len(prefix) : -len(".parq")]
+        if fname.startswith(prefix) and fname.endswith(".parq") and year.isdigit():
+            path = os.path.join(cache_dir, fname)
+            df = pandas.read_parquet(path)
+            entries = _dump_cached(df, data_name, int(year), transform_version=0)
+            _catalog().replace(data_name, [int(year)], entries)
+            os.remove(path)
+
+
+# =================
+# Catalog Functions
+# =================
+
+# What is cached is recorded in a SQLite catalog in the cache directory. Caches
+# created before the catalog kept a `metadata.json` file, which is migrated.
+
+
+METADATA_FNAME = "metadata.json"
+
+
+def _catalog() -> catalog.Catalog:
+    return catalog.Catalog(CONFIG_DATA["cache_dir"])
+
+
+def _migrate_metadata():
+    """
+    Record the data listed in a legacy `metadata.json` file in the catalog, then remove the file.
+    """
+    path = os.path.join(CONFIG_DATA["cache_dir"], METADATA_FNAME)
+    if not os.path.exists(path):
+        return
+    with open(path, "r") as file:
+        full_mdata = json.load(file)
+    cache_catalog = _catalog()
+    for data_name in full_mdata:
+        if data_name in YEARS_DATA_NAMES:
+            cached = cache_catalog.seasons(data_name)
+            for year in map(int, full_mdata[data_name]):
+                if year in cached:
+                    continue
+                entries = []
+                for file_path, rel_dir in _season_fragments(data_name, year):
+                    metadata = pyarrow.parquet.read_metadata(file_path)
+                    entries.append(
+                        catalog.create_entry(
+                            data_name,
+                            year,
+                            _partition_values(rel_dir).get("week"),
+                            file_path,
+                            metadata.schema.to_arrow_schema(),
+                            metadata.num_rows,
+                            0,
+                            "parquet",
+                        )
+                    )
+                if entries:
+                    cache_catalog.replace(data_name, [year], entries)
+        else:
+            file_path = os.path.join(CONFIG_DATA["cache_dir"], data_name + ".parq")
+            if full_mdata[data_name] and os.path.exists(file_path):
+                metadata = pyarrow.parquet.read_metadata(file_path)
+                entry = catalog.create_entry(
+                    data_name,
+                    None,
+                    None,
+                    file_path,
+                    metadata.schema.to_arrow_schema(),
+                    metadata.num_rows,
+                    0,
+                    "parquet",
+                )
+                cache_catalog.replace(data_name, [None], [entry])
+    os.remove(path)
+
+
+MIGRATE_LOCK = threading.Lock()
+
+
+def _migrate_cache(data_name: DATA_NAMES):
+    """
+    Migrate any legacy cache files for `data_name` to the partitioned layout and catalog.
+    """
+    with MIGRATE_LOCK:
+        if data_name in YEARS_DATA_NAMES:
+            _migrate_flat_cache(data_name)
+        _migrate_metadata()
+
+
+def cache_info(data_name: DATA_NAMES | None = None) -> pandas.DataFrame:
+    """
+    Get what is cached, read from the cache catalog without touching any cached data.
 
     Parameters
     ----------
 
-    data_name : {"pbp", "draft", "roster", "player", "schedule", "map"}
-        `data_name` to get the function for.
+    data_name : {"pbp", "draft", "roster", "player", "schedule", "map"} | None = None
+        Only get the entries for `data_name`. `None` gets all entries.
 
     Returns
     -------
 
-    out : dict
-    """
-    path = CONFIG_DATA["cache_dir"] + "metadata.json"
-    if os.path.exists(path):
-        full_mdata = {}
-        with open(path, "r") as file:
-            full_mdata = json.load(file)
-        if data_name in full_mdata:
-            if data_name in YEARS_DATA_NAMES:
-                mdata = {}
-                for year in full_mdata[data_name]:
-                    mdata[int(year)] = full_mdata[data_name][year]
-                return mdata
-            else:
-                return full_mdata[data_name]
+    out : pandas.DataFrame
+        One row per cached file with columns `data_name`, `season`, `week`, `path`, `rows`, `bytes`, `schema_hash`, `fetched_at`, `transform_version`, `format`, `content_hash`, `checked_at`, `accessed_at`, `compression_level`, `source` and `pinned`. `fetched_at` is when the data in the file last changed and `checked_at` is when it was last compared against the source, so together they are the high-water mark of each week. `accessed_at` is when the file was last loaded. `source` is the name of the source the season was fetched from (see `set_source()`).
+    """
+    return _catalog().entries(data_name)
+
+
+# =================
+# Disk Cache Budget
+# =================
+
+# The cache directory is kept within the budget set by `set_cache_budget()`.
+# Seasons are recompressed or evicted whole, under the same lock file used to
+# dump them, least recently used first. Seasons being read are not evicted:
+# readers in this process register them in `SEASON_READERS`, and seasons read
+# by any process in the last `EVICTION_GRACE` seconds are kept as well.
+
+
+SEASON_READERS = collections.Counter()
+SEASON_READERS_LOCK = threading.Lock()
+EVICTION_GRACE = 60.0
+
+
+def _register_readers(data_name: DATA_NAMES, years: list[int | None]) -> list:
+    """
+    Register the seasons `years` of `data_name` as being read by this process, until `_release_readers()` is called with the keys returned.
+    """
+    keys = [(CONFIG_DATA["cache_dir"], data_name, year) for year in set(years)]
+    with SEASON_READERS_LOCK:
+        SEASON_READERS.update(keys)
+    return keys
+
+
+def _release_readers(keys: list):
+    with SEASON_READERS_LOCK:
+        SEASON_READERS.subtract(keys)
+        for key in keys:
+            if SEASON_READERS[key] <= 0:
+                del SEASON_READERS[key]
+
+
+@contextlib.contextmanager
+def _reading_seasons(data_name: DATA_NAMES, years: list[int | None]):
+    """
+    Register the seasons `years` of `data_name` as being read by this process until the context exits.
+    """
+    keys = _register_readers(data_name, years)
+    try:
+        yield
+    finally:
+        _release_readers(keys)
+
+
+def _season_in_use(season: dict) -> bool:
+    """
+    Whether or not the season in `season`, a row of `catalog.season_usage()`, is being read or was read in the last `EVICTION_GRACE` seconds.
+    """
+    key = (CONFIG_DATA["cache_dir"], season["data_name"], season["season"])
+    with SEASON_READERS_LOCK:
+        if key in SEASON_READERS:
+            return True
+    return season["used_at"] is not None and (
+        time.time() - season["used_at"] < EVICTION_GRACE
+    )
+
+
+def _recompress_season(data_name: DATA_NAMES, year: int | None, level: int) -> int:
+    """
+    Rewrite the parquet files of the season `year` of `data_name` with zstd at `level`.
+
+    Returns
+    -------
+
+    out : int
+        Size of the season after recompressing.
+    """
+    cache_dir = CONFIG_DATA["cache_dir"]
+    with flight.FileLock(_lock_path(data_name, year)):
+        cache_catalog = _catalog()
+        entries = []
+        for entry in cache_catalog.season_entries(data_name, year):
+            path = os.path.join(cache_dir, entry["path"])
+            entry = dict(entry, path=path)
+            if entry["format"] == "parquet" and entry["compression_level"] != level:
+                table = pyarrow.parquet.ParquetFile(path).read()
+                _write_table(table, path, "parquet", level)
+                entry.update(bytes=os.path.getsize(path), compression_level=level)
+            entries.append(entry)
+        cache_catalog.replace(data_name, [year], entries)
+    return sum(entry["bytes"] for entry in entries)
+
+
+def _evict_season(data_name: DATA_NAMES, year: int | None):
+    """
+    Remove the season `year` of `data_name` from the cache.
+    """
+    with flight.FileLock(_lock_path(data_name, year)):
+        if year is None:
+            for path, _ in _cached_fragments(data_name, None):
+                os.remove(path)
         else:
-            return {}
-    else:
-        return {}
+            shutil.rmtree(_season_dir(data_name, year), ignore_errors=True)
+        _catalog().replace(data_name, [year], [])
+
+
+def _enforce_cache_budget(
+    protected: set[tuple[DATA_NAMES, int | None]] = frozenset(),
+    max_bytes: int | None = None,
+) -> list[dict]:
+    """
+    Recompress and evict seasons until the cache is within `max_bytes`, which defaults to the budget set by `set_cache_budget()`. Seasons in `protected` are neither recompressed nor evicted, and seasons in use (see `_season_in_use()`) are not evicted.
+
+    Returns
+    -------
+
+    out : list[dict]
+        `data_name`, `season`, `action` (`recompress` or `evict`) and `bytes` freed for each season changed.
+    """
+    if max_bytes is None:
+        max_bytes = CONFIG_DATA.get("cache_max_bytes")
+    if max_bytes is None:
+        return []
+    level = CONFIG_DATA.get("cache_recompress_level")
+    cache_catalog = _catalog()
+    total = cache_catalog.total_bytes()
+    if total <= max_bytes:
+        return []
+    usage = cache_catalog.season_usage()
+    latest = {}
+    for season in usage:
+        if season["season"] is not None:
+            latest[season["data_name"]] = max(
+                season["season"], latest.get(season["data_name"], season["season"])
+            )
+    actions = []
+    if level is not None:
+        for season in usage:
+            if total <= max_bytes:
+                break
+            key = (season["data_name"], season["season"])
+            if (
+                key in protected
+                or season["season"] is None
+                or season["season"] == latest[season["data_name"]]
+                or season["uncompressible"]
+                or season["compression_level"] == level
+            ):
+                continue
+            size = _recompress_season(*key, level)
+            actions.append(
+                {
+                    "data_name": key[0],
+                    "season": key[1],
+                    "action": "recompress",
+                    "bytes": season["bytes"] - size,
+                }
+            )
+            total -= season["bytes"] - size
+            season["bytes"] = size
+    for season in usage:
+        if total <= max_bytes:
+            break
+        key = (season["data_name"], season["season"])
+        if key in protected or season["pinned"] or _season_in_use(season):
+            continue
+        _evict_season(*key)
+        actions.append(
+            {
+                "data_name": key[0],
+                "season": key[1],
+                "action": "evict",
+                "bytes": season["bytes"],
+            }
+        )
+        total -= season["bytes"]
+    return actions
+
+
+def prune_cache(max_bytes: int | None = None) -> pandas.DataFrame:
+    """
+    Recompress and evict seasons until the cache directory is within budget. This is done automatically whenever data is added to the cache; call it after lowering the budget to apply it straight away. Seasons being read, or read by any process in the last `EVICTION_GRACE` seconds, are not evicted.
+
+    Parameters
+    ----------
 
+    max_bytes : int | None = None
+        Disk budget in bytes. `None` uses the budget set by `set_cache_budget()`.
+
+    Returns
+    -------
 
-def _dump_metadata(data_name: DATA_NAMES, mdata: dict[int, bool] | bool):
+    out : pandas.DataFrame
+        One row per season recompressed or evicted, with columns `data_name`, `season`, `action` (`recompress` or `evict`) and `bytes` freed.
+    """
+    if max_bytes is not None and (
+        not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes < 0
+    ):
+        raise ValueError("max_bytes must be a non-negative integer or None.")
+    actions = _enforce_cache_budget(max_bytes=max_bytes)
+    return pandas.DataFrame(actions, columns=["data_name", "season", "action", "bytes"])
+
+
+def pin_cache(
+    data_name: DATA_NAMES, years: list[int] | None = None, pinned: bool = True
+):
     """
-    Dump the metadata to the given `data_name` provided.
+    Pin seasons so they are never evicted to keep the cache within budget. Pins are saved in the cache catalog and apply to seasons cached later.
 
     Parameters
     ----------
 
     data_name : {"pbp", "draft", "roster", "player", "schedule", "map"}
-        `data_name` to get the function for.
+        `data_name` of the dataset to pin.
+
+    years : list[int] | None = None
+        Years to pin. `None` for non-years data.
 
-    mdata : dict[int, bool] | bool
-        The metadata to dump.
+    pinned : bool = True
+        Whether to pin or unpin the seasons.
     """
-    path = os.path.join(CONFIG_DATA["cache_dir"], "metadata.json")
-    full_mdata = {}
-    if os.path.exists(path):
-        with open(path, "r") as file:
-            full_mdata = json.load(file)
-    full_mdata[data_name] = mdata
-    with open(path, "w") as file:
-        json.dump(full_mdata, file)
+    _load_validate_data_name(data_name)
+    _load_validate_years(years)
+    if not isinstance(pinned, bool):
+        raise ValueError("pinned must be a bool.")
+    _catalog().set_pinned(data_name, years or [None], pinned)
 
 
 # ==================
@@ -156,12 +988,373 @@ def _dump_metadata(data_name: DATA_NAMES, mdata: dict[int, bool] | bool):
 # The load function calls one of these sub-function depending on the case.
 
 
+def _fetch_year(data_name: DATA_NAMES, year: int) -> pandas.DataFrame:
+    """
+    Fetch a single season of NFL data from `SOURCE` and transform it.
+    """
+    return _transform(data_name, SOURCE.fetch(data_name, [year]))
+
+
+def _rebuild_year(data_name: DATA_NAMES, year: int) -> pandas.DataFrame:
+    """
+    Re-transform a single cached season of NFL data.
+    """
+    return _transform(data_name, _load_cached(data_name, [year]))
+
+
+# ======================
+# Shared Store Functions
+# ======================
+
+# With a shared store set, the cache directory is a local read-through tier in
+# front of it. Seasons missing locally are copied from the shared store if it
+# has them, and seasons fetched from the source are written back to it, so the
+# machines sharing a store fetch each season from the source once. The catalog,
+# lock files and memory-mapped reads stay on the local disk.
+#
+# The shared store holds the cache files under their paths relative to the cache
+# directory, plus a manifest per season written after its files.
+
+
+SHARED_STORE = None
+MANIFESTS_DIRNAME = "_manifests"
+
+
+def set_shared_store(store: "stores.Store | str | None", **storage_options):
+    """
+    Set a store shared between machines for the local cache to read through, for this process.
+
+    Parameters
+    ----------
+
+    store : Store | str | None
+        e.g. `LocalStore("/mnt/shared/foopy")`, or a URL such as `"s3://bucket/foopy"` for an `FsspecStore`. `None` uses the local cache alone.
+
+    **storage_options
+        Passed to `FsspecStore` if `store` is a URL.
+    """
+    if isinstance(store, str):
+        store = stores.FsspecStore(store, **storage_options)
+    elif store is not None and not isinstance(store, stores.Store):
+        raise ValueError("store must be a Store, a URL or None.")
+    global SHARED_STORE
+    SHARED_STORE = store
+
+
+def _store_key(path: str) -> str:
+    return os.path.relpath(path, CONFIG_DATA["cache_dir"]).replace(os.sep, "/")
+
+
+def _manifest_key(data_name: DATA_NAMES, year: int | None) -> str:
+    season = "all" if year is None else str(year)
+    return f"{MANIFESTS_DIRNAME}/{data_name}/{season}.json"
+
+
+def _read_manifest(data_name: DATA_NAMES, year: int | None) -> dict | None:
+    try:
+        return json.loads(SHARED_STORE.read(_manifest_key(data_name, year)))
+    except FileNotFoundError:
+        return None
+
+
+def _push_season(
+    data_name: DATA_NAMES, year: int | None, entries: list[dict], source: str | None
+):
+    """
+    Write the cached files in `entries` of the season `year` of `data_name`, fetched from the source named `source`, to the shared store, then its manifest. Files the shared store already has are skipped.
+    """
+    manifest = _read_manifest(data_name, year) or {"files": []}
+    stored = {(file["key"], file["content_hash"]) for file in manifest["files"]}
+    files = []
+    for entry in entries:
+        key = _store_key(entry["path"])
+        if (key, entry["content_hash"]) not in stored or entry["content_hash"] is None:
+            with open(entry["path"], "rb") as file:
+                SHARED_STORE.write(key, file.read())
+        files.append(
+            {
+                "key": key,
+                "week": entry["week"],
+                "rows": entry["rows"],
+                "content_hash": entry["content_hash"],
+            }
+        )
+    manifest = {
+        "transform_version": TRANSFORM_VERSION,
+        "format": _cache_format(),
+        "source": source,
+        "checked_at": max((entry["checked_at"] for entry in entries), default=0),
+        "files": files,
+    }
+    SHARED_STORE.write(_manifest_key(data_name, year), json.dumps(manifest).encode())
+
+
+def _pull_season(
+    data_name: DATA_NAMES,
+    year: int | None,
+    previous: list[dict],
+    since: float,
+    source: str | None,
+) -> list[dict] | None:
+    """
+    Copy the season `year` of `data_name` from the shared store to the cache, if the shared store has it from the source named `source`, by the current transforms and in the current cache format. A season that is already cached locally (`previous`) is only copied if the shared store checked it after `since`.
+
+    Returns
+    -------
+
+    out : list[dict] | None
+        Catalog entries for the files copied, or `None` if nothing was copied.
+    """
+    manifest = _read_manifest(data_name, year)
+    if (
+        manifest is None
+        or manifest["transform_version"] != TRANSFORM_VERSION
+        or manifest["format"] != _cache_format()
+        or manifest.get("source") != source
+        or (previous and manifest["checked_at"] < since)
+    ):
+        return None
+    if year is None:
+        for path, _ in _cached_fragments(data_name, None):
+            os.remove(path)
+    else:
+        shutil.rmtree(_season_dir(data_name, year), ignore_errors=True)
+    entries = []
+    for file in manifest["files"]:
+        path = os.path.join(CONFIG_DATA["cache_dir"], *file["key"].split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as local_file:
+            local_file.write(SHARED_STORE.read(file["key"]))
+        os.replace(temp_path, path)
+        entries.append(
+            catalog.create_entry(
+                data_name,
+                year,
+                file["week"],
+                path,
+                _read_schema(path),
+                file["rows"],
+                TRANSFORM_VERSION,
+                manifest["format"],
+                file["content_hash"],
+                source=source,
+            )
+        )
+    return entries
+
+
+# A season is dumped by a single thread of a single process at a time. Threads
+# of this process share the dump already in flight, and processes sharing the
+# cache directory take a lock file per season. A process that waited for the
+# lock reuses the season if it was dumped after the process decided to dump it.
+
+SEASON_FLIGHTS = flight.SingleFlight()
+LOCKS_DIRNAME = ".locks"
+
+
+def _lock_path(data_name: DATA_NAMES, year: int | None) -> str:
+    fname = data_name if year is None else f"{data_name}-{year}"
+    return os.path.join(CONFIG_DATA["cache_dir"], LOCKS_DIRNAME, fname + ".lock")
+
+
+def _entry_current(entry: dict, since: float) -> bool:
+    """
+    Whether or not the catalog `entry` was checked against the source after `since`, by the current transforms and in the current cache format.
+    """
+    return (
+        entry["checked_at"] is not None
+        and entry["checked_at"] >= since
+        and entry["transform_version"] == TRANSFORM_VERSION
+        and entry["format"] == _cache_format()
+    )
+
+
+def _check_source(data_name: DATA_NAMES, year: int | None, source: str):
+    """
+    Raise a `ValueError` if seasons of `data_name` other than `year` are cached from a source other than the one named `source`. Sources don't return identical data, so a dataset is cached from a single source.
+    """
+    for season, season_source in _catalog().sources(data_name).items():
+        if season != year and season_source != source:
+            raise ValueError(
+                f'{data_name} is cached from the source "{season_source}", not "{source}". '
+                "Use set_cache_path() to cache it from another source in another directory."
+            )
+
+
+def _single_dump(
+    data_name: DATA_NAMES,
+    year: int | None,
+    create: typing.Callable[[], pandas.DataFrame],
+    since: float,
+    source: str | None = None,
+):
+    """
+    Create the season `year` of NFL data with `create`, dump it to cache and record it in the catalog, unless another thread or process does so first. A `year` of `None` is used for non-years data.
+
+    Parameters
+    ----------
+
+    since : float
+        Time the season was found to need dumping. The season is not dumped again if every partition of it has been checked since then.
+
+    source : str | None = None
+        Name of the source `create` fetches from. `None` if `create` rebuilds the cached season, which keeps its source.
+    """
+
+    def locked_dump():
+        with flight.FileLock(_lock_path(data_name, year)):
+            cache_catalog = _catalog()
+            previous = cache_catalog.season_entries(data_name, year)
+            if previous and all(_entry_current(entry, since) for entry in previous):
+                return
+            name = source
+            if name is None:
+                name = previous[0]["source"] if previous else None
+            else:
+                _check_source(data_name, year, name)
+            entries = None
+            if SHARED_STORE is not None:
+                entries = _pull_season(data_name, year, previous, since, name)
+                if entries is not None:
+                    _intern_season_IDs(data_name, year)
+            if entries is None:
+                entries = _dump_cached(create(), data_name, year, None, previous)
+                entries = [dict(entry, source=name) for entry in entries]
+                if SHARED_STORE is not None:
+                    _push_season(data_name, year, entries, name)
+            cache_catalog.replace(data_name, [year], entries)
+
+    SEASON_FLIGHTS.do((CONFIG_DATA["cache_dir"], data_name, year), locked_dump)
+
+
+def _dump_years(
+    data_name: DATA_NAMES,
+    years: list[int],
+    create: typing.Callable[[DATA_NAMES, int], pandas.DataFrame],
+    workers: int,
+    since: float,
+    source: str | None = None,
+):
+    """
+    Create the given `years` of NFL data with `create` and dump them to cache, using up to `workers` threads. Only the partitions that changed are rewritten. Each year is recorded in the catalog in its own transaction as soon as it is dumped. `source` is the name of the source `create` fetches from, see `_single_dump()`.
+    """
+
+    def dump(year: int):
+        _single_dump(data_name, year, lambda: create(data_name, year), since, source)
+
+    if workers == 1 or len(years) <= 1:
+        for year in years:
+            dump(year)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(dump, year) for year in years]:
+                future.result()
+
+
+def _update_years(
+    data_name: DATA_NAMES, years: list[int], update: bool, workers: int = 1
+) -> list[int]:
+    """
+    Make sure the given `years` of NFL data are cached in the current cache format and transformed by the current `TRANSFORM_VERSION`.
+
+    Parameters
+    ----------
+
+    data_name : {"pbp", "draft", "roster", "schedule"}
+        `data_name` to update the cache for.
+
+    years : list[int]
+        Years to update the cache for.
+
+    update : bool
+        Whether or not the latest cached year should be fetched again.
+
+    workers : int = 1
+        Maximum number of seasons to fetch concurrently.
+
+    Returns
+    -------
+
+    out : list[int]
+        Years that had to be fetched or rebuilt.
+    """
+    since = time.time()
+    cache_catalog = _catalog()
+    cached = cache_catalog.seasons(data_name)
+    stale = cache_catalog.stale_seasons(data_name, TRANSFORM_VERSION, _cache_format())
+    latest = max(cached) if cached else None
+    fetch_years = []
+    for year in years:
+        if year not in cached or (year == latest and update):
+            if year not in fetch_years:
+                fetch_years.append(year)
+    for year in years:
+        if (
+            year in stale
+            and year not in fetch_years
+            and _rounded_floats(data_name, year)
+        ):
+            fetch_years.append(year)
+    rebuild_years = []
+    for year in years:
+        if year in stale and year not in fetch_years + rebuild_years:
+            rebuild_years.append(year)
+    _dump_years(data_name, fetch_years, _fetch_year, workers, since, SOURCE.name)
+    _dump_years(data_name, rebuild_years, _rebuild_year, workers, since)
+    if fetch_years or rebuild_years:
+        _enforce_cache_budget({(data_name, year) for year in years})
+    return fetch_years + rebuild_years
+
+
+def _update_non_years(data_name: DATA_NAMES, update: bool) -> bool:
+    """
+    Make sure the non-years `data_name` is cached in the current cache format and transformed by the current `TRANSFORM_VERSION`, fetching it again if `update`.
+
+    Returns
+    -------
+
+    out : bool
+        Whether or not the data had to be fetched or rebuilt.
+    """
+    since = time.time()
+    cache_catalog = _catalog()
+    cached = cache_catalog.contains(data_name)
+    stale = None in cache_catalog.stale_seasons(
+        data_name, TRANSFORM_VERSION, _cache_format()
+    )
+    if cached and not update and not stale:
+        return False
+
+    if cached and not update and not _rounded_floats(data_name, None):
+        source = None
+
+        def create() -> pandas.DataFrame:
+            return _transform(data_name, _load_cached(data_name))
+
+    else:
+        source = SOURCE.name
+
+        def create() -> pandas.DataFrame:
+            return _transform(data_name, SOURCE.fetch(data_name, None))
+
+    _single_dump(data_name, None, create, since, source)
+    _enforce_cache_budget({(data_name, None)})
+    return True
+
+
 def _load_years(
     data_name: DATA_NAMES,
     years: list[int],
     update: bool,
-    mdata: dict[int],
-) -> pandas.DataFrame:
+    workers: int = 1,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    backend: BACKENDS = "pandas",
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+) -> "pandas.DataFrame | pyarrow.Table | polars.LazyFrame":
     """
     Load the NFL data for years data functions.
 
@@ -171,84 +1364,437 @@ def _load_years(
     data_name : {"pbp", "draft", "roster", "player", "schedule", "map"}
         `data_name` to get the data for.
 
-    years : list[int]
-        Years to get the data for.
+    years : list[int]
+        Years to get the data for.
+
+    update : bool
+        Whether or not the cached NFL data should be updated.
+
+    workers : int = 1
+        Maximum number of seasons to fetch concurrently.
+
+    columns : list[str] | None = None
+        Columns to read from the cache. `None` reads all columns.
+
+    filters : list | None = None
+        Row filters to apply when reading from the cache. `None` reads all rows.
+
+    backend : {"pandas", "arrow", "polars"} = "pandas"
+        Type of the data returned. `polars` returns a `polars.LazyFrame` over the cache.
+
+    compact : bool = False
+        Whether or not to return compact columns in their cached types.
+
+    id_encoding : {"str", "int", "dictionary"} = "str"
+        How to return ID columns.
+
+    canonical_teams : bool = False
+        Whether or not to map team columns to canonical abbreviations.
+    """
+    with _reading_seasons(data_name, years):
+        _update_years(data_name, years, update, workers)
+        _catalog().touch(data_name, years)
+        args = (
+            data_name,
+            years,
+            columns,
+            filters,
+            compact,
+            id_encoding,
+            canonical_teams,
+        )
+        if backend == "arrow":
+            return _load_cached_table(*args)
+        elif backend == "polars":
+            return _load_cached_lazy(*args)
+        df = _load_cached(*args)
+        return df
+
+
+def _load_non_years(
+    data_name: DATA_NAMES,
+    update: bool,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    backend: BACKENDS = "pandas",
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+) -> "pandas.DataFrame | pyarrow.Table | polars.LazyFrame":
+    """
+    Load the NFL data for non-years data functions.
+
+    Parameters
+    ----------
+
+    data_name : {"pbp", "draft", "roster", "player", "schedule", "map"}
+        `data_name` to get the data for.
+
+    update : bool
+        Whether or not the cached NFL data should be updated.
+
+    columns : list[str] | None = None
+        Columns to read from the cache. `None` reads all columns.
+
+    filters : list | None = None
+        Row filters to apply when reading from the cache. `None` reads all rows.
+
+    backend : {"pandas", "arrow", "polars"} = "pandas"
+        Type of the data returned. `polars` returns a `polars.LazyFrame` over the cache.
+
+    compact : bool = False
+        Whether or not to return compact columns in their cached types.
+
+    id_encoding : {"str", "int", "dictionary"} = "str"
+        How to return ID columns.
+
+    canonical_teams : bool = False
+        Whether or not to map team columns to canonical abbreviations.
+    """
+    with _reading_seasons(data_name, [None]):
+        _update_non_years(data_name, update)
+        _catalog().touch(data_name, [None])
+        args = (
+            data_name,
+            None,
+            columns,
+            filters,
+            compact,
+            id_encoding,
+            canonical_teams,
+        )
+        if backend == "arrow":
+            return _load_cached_table(*args)
+        elif backend == "polars":
+            return _load_cached_lazy(*args)
+        df = _load_cached(*args)
+        return df
+
+
+# =================================
+# Load Function Argument Validation
+# =================================
+
+# Validate the arugments passed to load(); raise ValueError if invalid.
+
+
+def _load_validate_data_name(data_name: DATA_NAMES):
+    if data_name not in DATA_NAMES_VALUES:
+        raise ValueError("data_name argument passed to load() invalid.")
+
+
+def _load_validate_years(years: list[int] | None):
+    if isinstance(years, list):
+        for year in years:
+            if not isinstance(year, int):
+                raise ValueError("years argument passed to load() invalid.")
+    elif years != None:
+        raise ValueError("years argument passed to load() invalid.")
+
+
+def _load_validate_update(update: bool):
+    if not isinstance(update, bool):
+        raise ValueError("update arguments passed to load() invalid.")
+
+
+def _load_validate_workers(workers: int):
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("workers argument passed to load() invalid.")
+
+
+def _load_validate_backend(backend: str):
+    if backend not in BACKEND_VALUES:
+        raise ValueError("backend argument passed to load() invalid.")
+
+
+def _load_validate_compact(compact: bool):
+    if not isinstance(compact, bool):
+        raise ValueError("compact argument passed to load() invalid.")
+
+
+def _load_validate_id_encoding(id_encoding: str):
+    if id_encoding not in ID_ENCODING_VALUES:
+        raise ValueError("id_encoding argument passed to load() invalid.")
+
+
+def _load_validate_canonical_teams(canonical_teams: bool):
+    if not isinstance(canonical_teams, bool):
+        raise ValueError("canonical_teams argument passed to load() invalid.")
+
+
+def _load_validate_chunk(chunk: str, rows: int | None):
+    if chunk not in CHUNK_VALUES:
+        raise ValueError("chunk argument passed to load_iter() invalid.")
+    if rows is not None and (
+        not isinstance(rows, int) or isinstance(rows, bool) or rows < 1
+    ):
+        raise ValueError("rows argument passed to load_iter() invalid.")
+
+
+def _load_validate_columns(columns: list | None):
+    if isinstance(columns, list):
+        for column in columns:
+            if not isinstance(column, str) and not isinstance(
+                getattr(column, "header", None), str
+            ):
+                raise ValueError("columns argument passed to load() invalid.")
+    elif columns != None:
+        raise ValueError("columns argument passed to load() invalid.")
+
+
+FILTER_OPS = {"==", "=", "!=", "<", "<=", ">", ">=", "in", "not in"}
+
+
+def _load_validate_filter(predicate: tuple):
+    if not isinstance(predicate, tuple) or len(predicate) != 3:
+        raise ValueError("filters argument passed to load() invalid.")
+    column, op, value = predicate
+    if not isinstance(column, str) and not isinstance(
+        getattr(column, "header", None), str
+    ):
+        raise ValueError("filters argument passed to load() invalid.")
+    if op not in FILTER_OPS:
+        raise ValueError(f'Filter operator "{op}" passed to load() invalid.')
+    if op in {"in", "not in"} and not isinstance(value, (list, set, tuple)):
+        raise ValueError("filters argument passed to load() invalid.")
+
+
+def _load_validate_filters(filters: list | None):
+    if isinstance(filters, list) and len(filters) > 0:
+        if all(isinstance(group, list) for group in filters):
+            for group in filters:
+                for predicate in group:
+                    _load_validate_filter(predicate)
+        else:
+            for predicate in filters:
+                _load_validate_filter(predicate)
+    elif filters != None:
+        raise ValueError("filters argument passed to load() invalid.")
+
+
+# ==================
+# Column Projections
+# ==================
+
+# Columns can be given to load() as header strings or as `cols` classes.
+
+
+def _column_header(column) -> str:
+    """
+    Get the header string for a column given as a string or a `cols` class.
+    """
+    if isinstance(column, str):
+        return column
+    else:
+        return column.header
+
+
+# ===========
+# Row Filters
+# ===========
+
+# Filters are given to load() in disjunctive normal form, the same as the
+# `filters` argument of `pyarrow.parquet.read_table`:
+#
+# * `[(column, op, value), ...]` keeps rows matching every predicate.
+# * `[[(column, op, value), ...], ...]` keeps rows matching any inner list.
+
+
+def _filter_expression(filters: list | None) -> pyarrow.dataset.Expression | None:
+    if filters is None:
+        return None
+    return pyarrow.parquet.filters_to_expression(filters)
+
+
+FILTER_COMPARISONS = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
 
-    update : bool
-        Whether or not the cached NFL data should be updated.
 
-    mdata : bool
-        Whether or not cached NFL data exists.
+def _polars_expression(polars, filters: list):
     """
-    dfs = []
-    for year in years:
-        if year not in mdata or (year == max(mdata) and update):
-            df = NFL_DATA_FUNCS[data_name]([year])
-            _dump_cached(df, data_name + "-" + str(year))
-            mdata[year] = True
-            dfs.append(df)
+    Convert `filters` to a `polars.Expr`.
+    """
+    if all(isinstance(group, list) for group in filters):
+        groups = [_polars_expression(polars, group) for group in filters]
+        return functools.reduce(operator.or_, groups)
+    expressions = []
+    for column, op, value in filters:
+        if op == "in":
+            expressions.append(polars.col(column).is_in(list(value)))
+        elif op == "not in":
+            expressions.append(~polars.col(column).is_in(list(value)))
         else:
-            df = _load_cached(data_name + "-" + str(year))
-            dfs.append(df)
-        _dump_metadata(data_name, mdata)
-    df = pandas.concat(dfs)
-    return df
+            expressions.append(FILTER_COMPARISONS[op](polars.col(column), value))
+    return functools.reduce(operator.and_, expressions)
 
 
-def _load_non_years(
-    data_name: DATA_NAMES,
-    update: bool,
-    mdata: bool,
-) -> pandas.DataFrame:
+def _filter_headers(filters: list | None) -> list | None:
     """
-    Load the NFL data for non-years data functions.
+    Replace any `cols` classes in `filters` with their header strings.
+    """
+    if filters is None:
+        return None
+    if all(isinstance(group, list) for group in filters):
+        return [_filter_headers(group) for group in filters]
+    return [
+        (_column_header(column), op, list(value) if isinstance(value, set) else value)
+        for column, op, value in filters
+    ]
 
-    Parameters
-    ----------
 
-    data_name : {"pbp", "draft", "roster", "player", "schedule", "map"}
-        `data_name` to get the data for.
+# ====================
+# Compact Column Types
+# ====================
 
-    update : bool
-        Whether or not the cached NFL data should be updated.
+# Columns in a compact type table (see `cols.pbp_types`) are cast to smaller
+# types before they are cached. The original type of each cast column is kept
+# in its field metadata, so load() can cast it back unless `compact=True`.
+# Columns whose values don't fit their compact type are cached unchanged, and
+# float columns are only stored as `float32` if no value is rounded by it.
+
+
+COMPACT_TYPES = {
+    "pbp": (cols.pbp_types.PBP_TYPES, cols.pbp_types.DEFAULT_FLOAT_TYPE),
+}
+COMPACT_ARROW_TYPES = {
+    "int8": pyarrow.int8(),
+    "int16": pyarrow.int16(),
+    "bool": pyarrow.bool_(),
+    "float32": pyarrow.float32(),
+    "category": pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+}
+COMPACT_PANDAS_TYPES = {
+    pyarrow.int8(): pandas.Int8Dtype(),
+    pyarrow.int16(): pandas.Int16Dtype(),
+    pyarrow.bool_(): pandas.BooleanDtype(),
+}
+CODE_PANDAS_TYPES = {pyarrow.int32(): pandas.Int32Dtype()}
+ORIGINAL_TYPE_KEY = b"foopy.original_type"
 
-    mdata : bool
-        Whether or not cached NFL data exists.
+
+def _compact_type(
+    data_name: DATA_NAMES, field: pyarrow.Field
+) -> pyarrow.DataType | None:
     """
-    if mdata and not update:
-        df = _load_cached(data_name)
-        return df
+    Get the compact type of the column `field` of `data_name`, or `None` if it is not compacted.
+    """
+    types, float_type = COMPACT_TYPES[data_name]
+    if field.name in ID_COLUMNS[data_name]:
+        return None
+    elif field.name in types:
+        return COMPACT_ARROW_TYPES[types[field.name]]
+    elif pyarrow.types.is_float64(field.type):
+        return COMPACT_ARROW_TYPES[float_type]
     else:
-        df = NFL_DATA_FUNCS[data_name]()
-        _dump_cached(df, data_name)
-        _dump_metadata(data_name, True)
-        return df
+        return None
 
 
-# =================================
-# Load Function Argument Validation
-# =================================
+def _compact_table(data_name: DATA_NAMES, table: pyarrow.Table) -> pyarrow.Table:
+    """
+    Cast the columns of `table` to their compact types for `data_name`.
+    """
+    if data_name not in COMPACT_TYPES:
+        return table
+    for index, field in enumerate(table.schema):
+        if _original_type(field) is not None:
+            continue
+        compact_type = _compact_type(data_name, field)
+        if compact_type is None or field.type == compact_type:
+            continue
+        try:
+            column = table.column(index).cast(compact_type)
+        except pyarrow.ArrowException:
+            continue
+        if pyarrow.types.is_floating(compact_type) and not _lossless(
+            table.column(index), column
+        ):
+            continue
+        metadata = {ORIGINAL_TYPE_KEY: str(field.type).encode()}
+        field = field.with_type(compact_type).with_metadata(metadata)
+        table = table.set_column(index, field, column)
+    return table
+
+
+def _lossless(original: pyarrow.ChunkedArray, column: pyarrow.ChunkedArray) -> bool:
+    """
+    Whether or not casting `column` back to the type of `original` gives the same values. `NaN` values count as equal.
+    """
+    restored = column.cast(original.type)
+    same = pyarrow.compute.or_(
+        pyarrow.compute.equal(restored, original), pyarrow.compute.is_nan(original)
+    )
+    return pyarrow.compute.all(same).as_py() is not False
 
-# Validate the arugments passed to load(); raise ValueError if invalid.
 
+def _original_type(field: pyarrow.Field) -> pyarrow.DataType | None:
+    """
+    Get the type of the column `field` before it was compacted, or `None` if it is not compact.
+    """
+    if field.metadata is None or ORIGINAL_TYPE_KEY not in field.metadata:
+        return None
+    return pyarrow.type_for_alias(field.metadata[ORIGINAL_TYPE_KEY].decode())
 
-def _load_validate_data_name(data_name: DATA_NAMES):
-    if data_name not in DATA_NAMES_VALUES:
-        raise ValueError("data_name argument passed to load() invalid.")
 
+# Before `TRANSFORM_VERSION` 5, float columns were stored as `float32` even if
+# that rounded them. Rebuilding such a season from the cache would keep the
+# rounded values, so it is fetched again instead.
 
-def _load_validate_years(years: list[int] | None):
-    if isinstance(years, list):
-        for year in years:
-            if not isinstance(year, int):
-                raise ValueError("years argument passed to load() invalid.")
-    elif years != None:
-        raise ValueError("years argument passed to load() invalid.")
+LOSSLESS_FLOATS_VERSION = 5
 
 
-def _load_validate_update(update: bool):
-    if not isinstance(update, bool):
-        raise ValueError("update arguments passed to load() invalid.")
+def _rounded_floats(data_name: DATA_NAMES, year: int | None) -> bool:
+    """
+    Whether or not the cached season `year` of `data_name` may hold float columns rounded to `float32`.
+    """
+    for entry in _catalog().season_entries(data_name, year):
+        if entry["transform_version"] >= LOSSLESS_FLOATS_VERSION:
+            continue
+        path = os.path.join(CONFIG_DATA["cache_dir"], entry["path"])
+        for field in _read_schema(path):
+            if pyarrow.types.is_float32(field.type) and pyarrow.types.is_float64(
+                _original_type(field) or field.type
+            ):
+                return True
+    return False
+
+
+def _restore_table(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    Cast the compact columns of `table` back to their original types.
+    """
+    for index, field in enumerate(table.schema):
+        original = _original_type(field)
+        if original is not None:
+            column = table.column(index).cast(original)
+            field = field.with_type(original).remove_metadata()
+            table = table.set_column(index, field, column)
+    return table
+
+
+def _table_to_pandas(table: pyarrow.Table, compact: bool) -> pandas.DataFrame:
+    """
+    Convert `table` to pandas. Compact integer columns become nullable pandas integers if `compact`, rather than `float64` when they contain nulls. Integer ID codes always become nullable `Int32` columns.
+    """
+    types_mapper = COMPACT_PANDAS_TYPES.get if compact else None
+    codes = [
+        field.name
+        for field in table.schema
+        if pyarrow.types.is_int32(field.type)
+        and field.metadata is not None
+        and ID_SYSTEM_KEY in field.metadata
+    ]
+    if not codes:
+        return table.to_pandas(types_mapper=types_mapper)
+    df = table.drop_columns(codes).to_pandas(types_mapper=types_mapper)
+    codes_df = table.select(codes).to_pandas(types_mapper=CODE_PANDAS_TYPES.get)
+    return pandas.concat([df, codes_df], axis=1)[table.column_names]
 
 
 # ==========================
@@ -269,14 +1815,134 @@ def _load_team_abbrs():
         TEAM_ABBRS = copy.deepcopy(abbrs)
 
 
-_load_team_abbrs()
+# Loaded on first use rather than on import.
+
+
+def _team_abbrs() -> dict[str, str]:
+    if not TEAM_ABBRS:
+        _load_team_abbrs()
+    return TEAM_ABBRS
+
+
+# With `canonical_teams`, load() maps every team column through `TEAM_ABBRS`
+# to a categorical with the canonical abbreviations as its fixed categories, so
+# team columns of every dataset share one dtype. Abbreviations not in
+# `TEAM_ABBRS` (e.g. free agents) become null. Filters are applied to the
+# abbreviations before they are mapped.
+
+PBP_TEAM_COLUMNS = [
+    "posteam",
+    "defteam",
+    "home_team",
+    "away_team",
+    "possession_team",
+    "td_team",
+    "timeout_team",
+    "penalty_team",
+    "return_team",
+    "solo_tackle_1_team",
+    "solo_tackle_2_team",
+    "assist_tackle_1_team",
+    "assist_tackle_2_team",
+    "assist_tackle_3_team",
+    "assist_tackle_4_team",
+    "tackle_with_assist_1_team",
+    "tackle_with_assist_2_team",
+    "forced_fumble_player_1_team",
+    "forced_fumble_player_2_team",
+    "fumbled_1_team",
+    "fumbled_2_team",
+    "fumble_recovery_1_team",
+    "fumble_recovery_2_team",
+]
+TEAM_COLUMNS = {
+    "pbp": PBP_TEAM_COLUMNS,
+    "draft": ["team"],
+    "roster": ["team", "draft_club"],
+    "player": ["team_abbr", "draft_club"],
+    "schedule": ["home_team", "away_team"],
+    "map": ["team"],
+}
 
 
-def _get_team_abbr(abbr: str) -> str:
-    if abbr in TEAM_ABBRS:
-        return TEAM_ABBRS[abbr]
-    else:
-        return None
+def _canonical_teams() -> list[str]:
+    return sorted(set(_team_abbrs().values()))
+
+
+def team_dtype() -> pandas.CategoricalDtype:
+    """
+    Get the categorical dtype of team columns loaded with `canonical_teams=True`, to convert other team data to.
+    """
+    return pandas.CategoricalDtype(_canonical_teams())
+
+
+def _canonicalize_teams(data_name: DATA_NAMES, table: pyarrow.Table) -> pyarrow.Table:
+    """
+    Replace the team columns of `table` with dictionary columns of their canonical abbreviations, all sharing the dictionary `_canonical_teams()`.
+    """
+    abbrs = _team_abbrs()
+    teams = _canonical_teams()
+    dictionary = pyarrow.array(teams, pyarrow.string())
+    value_set = pyarrow.array(list(abbrs), pyarrow.string())
+    # Code of the canonical team of each abbreviation in `value_set`.
+    abbr_codes = pyarrow.array(
+        [teams.index(team) for team in abbrs.values()], pyarrow.int8()
+    )
+    for column in TEAM_COLUMNS[data_name]:
+        index = table.schema.get_field_index(column)
+        if index == -1:
+            continue
+        values = table.column(index).cast(pyarrow.string())
+        abbr_index = pyarrow.compute.index_in(values, value_set=value_set)
+        codes = pyarrow.compute.take(abbr_codes, abbr_index)
+        if isinstance(codes, pyarrow.ChunkedArray):
+            chunks = codes.chunks
+        else:
+            chunks = [codes]
+        column_codes = pyarrow.chunked_array(
+            [
+                pyarrow.DictionaryArray.from_arrays(chunk, dictionary)
+                for chunk in chunks
+            ],
+            pyarrow.dictionary(pyarrow.int8(), pyarrow.string()),
+        )
+        field = table.field(index).with_type(column_codes.type).remove_metadata()
+        table = table.set_column(index, field, column_codes)
+    return table
+
+
+def _canonicalize_teams_lazy(
+    polars, data_name: DATA_NAMES, lazy: "polars.LazyFrame", schema: pyarrow.Schema
+) -> "polars.LazyFrame":
+    """
+    Map the team columns of `lazy` like `_canonicalize_teams()`, to `polars.Enum` columns.
+    """
+    abbrs = _team_abbrs()
+    enum = polars.Enum(_canonical_teams())
+    casts = [
+        polars.col(column)
+        .cast(polars.String)
+        .replace(list(abbrs), list(abbrs.values()))
+        .cast(enum, strict=False)
+        for column in TEAM_COLUMNS[data_name]
+        if column in schema.names
+    ]
+    return lazy.with_columns(casts)
+
+
+# =====================
+# Optional Dependencies
+# =====================
+
+
+def _import_polars():
+    try:
+        import polars
+    except ImportError as error:
+        raise ImportError(
+            'backend="polars" requires polars: pip install "foopy[polars]"'
+        ) from error
+    return polars
 
 
 # =================
@@ -286,6 +1952,8 @@ def _get_team_abbr(abbr: str) -> str:
 
 DRAFT_IDS_DATA_NAMES = typing.Literal["draft", "player", "roster"]
 DRAFT_IDS_DATA_NAMES_VALUES = {"draft", "player", "roster"}
+# Characters removed from player names.
+DRAFT_ID_NAME_PATTERN = r"[ .'-]"
 
 
 def _create_draft_id(
@@ -319,25 +1987,42 @@ def _create_draft_id(
         team = df[cols.roster.DraftClub.header]
         overall = df[cols.roster.DraftNumber.header].fillna(0)
         name = df[cols.roster.PlayerName.header]
-    team = team.apply(_get_team_abbr)
-    overall = overall.astype(int).astype(str).replace("0", None)
-    name = (
-        name.str.replace(" ", "", regex=False)
-        .str.replace(".", "", regex=False)
-        .str.replace("-", "", regex=False)
-        .str.replace("'", "", regex=False)
+    # Built with Arrow compute kernels over whole columns. A missing team,
+    # overall number (or 0) or name makes the draft ID null.
+    abbrs = _team_abbrs()
+    team = _string_array(team)
+    team_index = pyarrow.compute.index_in(team, value_set=pyarrow.array(list(abbrs)))
+    team = pyarrow.compute.take(pyarrow.array(list(abbrs.values())), team_index)
+    overall = pyarrow.array(overall, from_pandas=True)
+    overall = pyarrow.compute.cast(overall, pyarrow.int64(), safe=False)
+    overall = pyarrow.compute.if_else(
+        pyarrow.compute.equal(overall, 0),
+        None,
+        pyarrow.compute.cast(overall, pyarrow.string()),
     )
-    df[cols.draft.DraftId.header] = (team.notna() & overall.notna() & name.notna()) * (
-        team + overall + name
+    name = pyarrow.compute.replace_substring_regex(
+        _string_array(name), DRAFT_ID_NAME_PATTERN, ""
     )
+    draft_id = pyarrow.compute.binary_join_element_wise(team, overall, name, "")
+    df[cols.draft.DraftId.header] = draft_id.to_numpy(zero_copy_only=False)
     return df
 
 
+def _string_array(values: pandas.Series) -> pyarrow.Array:
+    """
+    Convert `values` to a string array, with NaN as null.
+    """
+    array = pyarrow.array(values, from_pandas=True)
+    return pyarrow.compute.cast(array, pyarrow.string())
+
+
 # ==================
 # ID Column Cleaning
 # ==================
 
-# TODO fix pbp
+# Every ID column is normalised to strings with missing IDs as nulls. IDs
+# declared `int` may come as floats (NaN for missing), so they are truncated to
+# integers first, e.g. `3139477.0` becomes `"3139477"`.
 
 DRAFT_ID_COLUMNS = {
     "gsis_id": str,
@@ -376,65 +2061,65 @@ SCHEDULE_ID_COLUMNS = {
     "home_qb_id": str,
     "stadium_id": str,
 }
-PBP_ID_COLUMNS = [
-    "play_id",
-    "game_id",
-    "old_game_id_x",
-    "td_player_id",
-    "passer_player_id",
-    "receiver_player_id",
-    "rusher_player_id",
-    "lateral_receiver_player_id",
-    "lateral_rusher_player_id",
-    "lateral_sack_player_id",
-    "interception_player_id",
-    "lateral_interception_player_id",
-    "punt_returner_player_id",
-    "lateral_punt_returner_player_id",
-    "kickoff_returner_player_id",
-    "lateral_kickoff_returner_player_id",
-    "punter_player_id",
-    "kicker_player_id",
-    "own_kickoff_recovery_player_id",
-    "blocked_player_id",
-    "tackle_for_loss_1_player_id",
-    "tackle_for_loss_2_player_id",
-    "qb_hit_1_player_id",
-    "qb_hit_2_player_id",
-    "forced_fumble_player_1_player_id",
-    "forced_fumble_player_2_player_id",
-    "solo_tackle_1_player_id",
-    "solo_tackle_2_player_id",
-    "assist_tackle_1_player_id",
-    "assist_tackle_2_player_id",
-    "assist_tackle_3_player_id",
-    "assist_tackle_4_player_id",
-    "tackle_with_assist_1_player_id",
-    "tackle_with_assist_2_player_id",
-    "pass_defense_1_player_id",
-    "pass_defense_2_player_id",
-    "fumbled_1_player_id",
-    "fumbled_2_player_id",
-    "fumble_recovery_1_player_id",
-    "fumble_recovery_2_player_id",
-    "sack_player_id",
-    "half_sack_1_player_id",
-    "half_sack_2_player_id",
-    "penalty_player_id",
-    "safety_player_id",
-    "nfl_api_id",
-    "drive_play_id_started",
-    "drive_play_id_ended",
-    "stadium_id",
-    "passer_id",
-    "rusher_id",
-    "receiver_id",
-    "id",
-    "fantasy_player_id",
-    "fantasy_id",
-    "nflverse_game_id",
-    "old_game_id_y",
-]
+PBP_ID_COLUMNS = {
+    "play_id": int,
+    "game_id": str,
+    "old_game_id_x": int,
+    "td_player_id": str,
+    "passer_player_id": str,
+    "receiver_player_id": str,
+    "rusher_player_id": str,
+    "lateral_receiver_player_id": str,
+    "lateral_rusher_player_id": str,
+    "lateral_sack_player_id": str,
+    "interception_player_id": str,
+    "lateral_interception_player_id": str,
+    "punt_returner_player_id": str,
+    "lateral_punt_returner_player_id": str,
+    "kickoff_returner_player_id": str,
+    "lateral_kickoff_returner_player_id": str,
+    "punter_player_id": str,
+    "kicker_player_id": str,
+    "own_kickoff_recovery_player_id": str,
+    "blocked_player_id": str,
+    "tackle_for_loss_1_player_id": str,
+    "tackle_for_loss_2_player_id": str,
+    "qb_hit_1_player_id": str,
+    "qb_hit_2_player_id": str,
+    "forced_fumble_player_1_player_id": str,
+    "forced_fumble_player_2_player_id": str,
+    "solo_tackle_1_player_id": str,
+    "solo_tackle_2_player_id": str,
+    "assist_tackle_1_player_id": str,
+    "assist_tackle_2_player_id": str,
+    "assist_tackle_3_player_id": str,
+    "assist_tackle_4_player_id": str,
+    "tackle_with_assist_1_player_id": str,
+    "tackle_with_assist_2_player_id": str,
+    "pass_defense_1_player_id": str,
+    "pass_defense_2_player_id": str,
+    "fumbled_1_player_id": str,
+    "fumbled_2_player_id": str,
+    "fumble_recovery_1_player_id": str,
+    "fumble_recovery_2_player_id": str,
+    "sack_player_id": str,
+    "half_sack_1_player_id": str,
+    "half_sack_2_player_id": str,
+    "penalty_player_id": str,
+    "safety_player_id": str,
+    "nfl_api_id": str,
+    "drive_play_id_started": int,
+    "drive_play_id_ended": int,
+    "stadium_id": str,
+    "passer_id": str,
+    "rusher_id": str,
+    "receiver_id": str,
+    "id": str,
+    "fantasy_player_id": str,
+    "fantasy_id": str,
+    "nflverse_game_id": str,
+    "old_game_id_y": int,
+}
 MAP_ID_COLUMNS = {
     "rotoworld_id": int,
     "cfbref_id": str,
@@ -468,17 +2153,266 @@ ID_COLUMNS = {
 }
 
 
+def _clean_ID_array(values: pandas.Series, id_type: type) -> pyarrow.Array:
+    """
+    Normalise the ID column `values` declared as `id_type` to a string array, with empty strings as nulls.
+    """
+    try:
+        array = pyarrow.array(values, from_pandas=True)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # Object columns mixing numbers and strings.
+        array = pyarrow.array(values.where(values.isna(), values.astype(str)))
+    if pyarrow.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    if id_type == int and (
+        pyarrow.types.is_floating(array.type) or pyarrow.types.is_integer(array.type)
+    ):
+        array = pyarrow.compute.cast(array, pyarrow.int64(), safe=False)
+    array = pyarrow.compute.cast(array, pyarrow.string())
+    return pyarrow.compute.if_else(pyarrow.compute.equal(array, ""), None, array)
+
+
 def _clean_IDs(data_name: DATA_NAMES, df: pandas.DataFrame) -> pandas.DataFrame:
     """
     Ensure all ID related columns are dtype string.
     """
-    for column in ID_COLUMNS[data_name]:
-        notna = df[column].notna() & (df[column] != "")
-        if ID_COLUMNS[data_name][column] == int:
-            df.loc[notna, column] = df.loc[notna, column].astype(int).astype(str)
-        else:
-            df.loc[notna, column] = df.loc[notna, column].astype(str)
-        df[column] = df[column].replace("", None)
+    id_columns = ID_COLUMNS[data_name]
+    arrays = {
+        column: _clean_ID_array(df[column], id_type)
+        for column, id_type in id_columns.items()
+        if column in df.columns
+    }
+    if not arrays:
+        return df
+    cleaned = pyarrow.table(arrays).to_pandas().set_axis(df.index)
+    # Replacing the columns in one concat is much faster than setting them one
+    # by one, which splits the frame's blocks on every column.
+    rest = df.drop(columns=list(arrays))
+    return pandas.concat([rest, cleaned], axis=1)[df.columns]
+
+
+# ===================
+# Integer ID Encoding
+# ===================
+
+# With an `id_encoding` other than "str", load() returns ID columns as int32
+# codes from the ID dictionaries in the catalog (see `Catalog.intern_ids()`).
+# Columns holding the same kind of ID share an ID system and so the same codes,
+# e.g. the pbp player columns and the roster `player_id` are all `gsis_id`. IDs
+# are given codes when the season holding them is cached, so encoding a lazy
+# scan only reads the dictionaries. Filters are applied to the IDs before they
+# are encoded.
+
+
+ID_SYSTEM_KEY = b"foopy.id_system"
+
+PBP_ID_SYSTEMS = {
+    **{column: "gsis_id" for column in PBP_ID_COLUMNS if column.endswith("player_id")},
+    **dict.fromkeys(["passer_id", "rusher_id", "receiver_id", "id"], "gsis_id"),
+    "fantasy_id": "gsis_id",
+    "game_id": "game_id",
+    "nflverse_game_id": "game_id",
+    "old_game_id_x": "old_game_id",
+    "old_game_id_y": "old_game_id",
+    # Play IDs are only unique within a game, so they are not encoded.
+    "play_id": None,
+    "drive_play_id_started": None,
+    "drive_play_id_ended": None,
+}
+ID_SYSTEMS = {
+    "pbp": PBP_ID_SYSTEMS,
+    "draft": {"pfr_player_id": "pfr_id", "cfb_player_id": "cfbref_id"},
+    "roster": {"player_id": "gsis_id"},
+    "schedule": {"away_qb_id": "gsis_id", "home_qb_id": "gsis_id"},
+}
+
+# Dictionaries read from the catalog, by cache directory and ID system. Codes
+# never change, so a dictionary is only read again when it is missing IDs or
+# other processes have added IDs to the catalog.
+ID_DICTIONARIES = {}
+ID_DICTIONARIES_LOCK = threading.Lock()
+
+
+def _id_system(data_name: DATA_NAMES, column: str) -> str | None:
+    """
+    Get the ID system of `column` of `data_name`, or `None` if it is not encoded. ID columns not listed in `ID_SYSTEMS` are their own ID system.
+    """
+    if column not in ID_COLUMNS[data_name]:
+        return None
+    return ID_SYSTEMS.get(data_name, {}).get(column, column)
+
+
+def _id_dictionary(system: str, ids: pyarrow.Array | None = None) -> pyarrow.Array:
+    """
+    Get the dictionary of `system` as an array of IDs in code order, first giving codes to any of the unique, non-null `ids` without one. Without `ids`, the dictionary is read again if other processes have given codes to IDs since it was last read.
+    """
+    key = (CONFIG_DATA["cache_dir"], system)
+    with ID_DICTIONARIES_LOCK:
+        dictionary = ID_DICTIONARIES.get(key)
+        if dictionary is None or (
+            ids is None and _catalog().id_count(system) != len(dictionary)
+        ):
+            dictionary = pyarrow.array(
+                _catalog().id_dictionary(system), pyarrow.string()
+            )
+        if ids is not None:
+            known = pyarrow.compute.is_in(ids, value_set=dictionary)
+            missing = ids.filter(pyarrow.compute.invert(known))
+            if len(missing) > 0:
+                cache_catalog = _catalog()
+                cache_catalog.intern_ids(system, missing.to_pylist())
+                dictionary = pyarrow.array(
+                    cache_catalog.id_dictionary(system), pyarrow.string()
+                )
+        ID_DICTIONARIES[key] = dictionary
+        return dictionary
+
+
+def _id_columns(data_name: DATA_NAMES, schema: pyarrow.Schema) -> dict[str, list[str]]:
+    """
+    Get the columns of `schema` to encode, for each ID system in `schema`.
+    """
+    systems = {}
+    for field in schema:
+        system = _id_system(data_name, field.name)
+        if system is not None and (
+            pyarrow.types.is_string(field.type) or pyarrow.types.is_null(field.type)
+        ):
+            systems.setdefault(system, []).append(field.name)
+    return systems
+
+
+def _id_dictionaries(
+    data_name: DATA_NAMES, table: pyarrow.Table
+) -> dict[str, tuple[list[str], pyarrow.Array]]:
+    """
+    Get the encoded columns of `table` and the dictionary covering their IDs, for each ID system in `table`. IDs of `table` without a code are given one.
+    """
+    dictionaries = {}
+    for system, columns in _id_columns(data_name, table.schema).items():
+        chunks = [
+            chunk.cast(pyarrow.string())
+            for column in columns
+            for chunk in table.column(column).chunks
+        ]
+        ids = pyarrow.chunked_array(chunks, pyarrow.string()).unique().drop_null()
+        dictionaries[system] = (columns, _id_dictionary(system, ids))
+    return dictionaries
+
+
+def _encode_IDs(
+    data_name: DATA_NAMES, table: pyarrow.Table, id_encoding: ID_ENCODINGS
+) -> pyarrow.Table:
+    """
+    Replace the ID columns of `table` with their codes, as `int32` columns if `id_encoding` is "int" or as dictionary columns sharing the dictionary of their ID system if "dictionary". Encoded fields record their ID system in their metadata.
+    """
+    if id_encoding == "str":
+        return table
+    for system, (columns, dictionary) in _id_dictionaries(data_name, table).items():
+        for column in columns:
+            index = table.schema.get_field_index(column)
+            values = table.column(index).cast(pyarrow.string())
+            codes = pyarrow.compute.index_in(values, value_set=dictionary)
+            if id_encoding == "dictionary":
+                codes = pyarrow.chunked_array(
+                    [
+                        pyarrow.DictionaryArray.from_arrays(chunk, dictionary)
+                        for chunk in codes.chunks
+                    ],
+                    pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+                )
+            field = table.field(index).with_type(codes.type)
+            field = field.with_metadata({ID_SYSTEM_KEY: system.encode()})
+            table = table.set_column(index, field, codes)
+    return table
+
+
+def _encode_IDs_lazy(
+    polars,
+    data_name: DATA_NAMES,
+    lazy: "polars.LazyFrame",
+    dataset: pyarrow.dataset.Dataset,
+    id_encoding: ID_ENCODINGS,
+) -> "polars.LazyFrame":
+    """
+    Encode the ID columns of `lazy`, a scan of `dataset`, like `_encode_IDs()`. Nothing is read from `dataset`, since its IDs were given codes when it was cached. Dictionary columns are `polars.Enum` columns.
+    """
+    if id_encoding == "str":
+        return lazy
+    casts = []
+    for system, columns in _id_columns(data_name, dataset.schema).items():
+        dictionary = _id_dictionary(system)
+        enum = polars.Enum(dictionary.to_pylist())
+        for column in columns:
+            expression = polars.col(column).cast(polars.String).cast(enum)
+            if id_encoding == "int":
+                expression = expression.to_physical().cast(polars.Int32)
+            casts.append(expression)
+    return lazy.with_columns(casts)
+
+
+def _intern_IDs(data_name: DATA_NAMES, table: pyarrow.Table):
+    """
+    Give codes to the IDs of `table`, data of `data_name` being cached, that don't have one yet.
+    """
+    _id_dictionaries(data_name, table)
+
+
+def _intern_season_IDs(data_name: DATA_NAMES, year: int | None):
+    """
+    Give codes to the IDs of the cached season `year` of `data_name` that don't have one yet. Only the ID columns are read.
+    """
+    fragments = _cached_fragments(data_name, None if year is None else [year])
+    if not fragments:
+        return
+    dataset = _cached_dataset(fragments)
+    columns = [
+        column
+        for columns in _id_columns(data_name, dataset.schema).values()
+        for column in columns
+    ]
+    _intern_IDs(data_name, dataset.to_table(columns=columns))
+
+
+def id_dictionary(system: str) -> pandas.Series:
+    """
+    Get the IDs of an ID system that have been given codes, to decode ID columns loaded with `id_encoding="int"`.
+
+    Parameters
+    ----------
+
+    system : str
+        ID system, e.g. `gsis_id` for player IDs or `game_id`.
+
+    Returns
+    -------
+
+    out : pandas.Series
+        IDs indexed by their codes.
+    """
+    return _id_dictionary(system).to_pandas().rename(system)
+
+
+# ==========
+# Transforms
+# ==========
+
+# Transforms are applied once before data is dumped to cache, so cached data is
+# already transformed. Bump `TRANSFORM_VERSION` whenever a transform changes;
+# cached data from an older version is re-transformed on its next load.
+# Transforms must give the same result when applied to their own output.
+
+
+TRANSFORM_VERSION = 5
+
+
+def _transform(data_name: DATA_NAMES, df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Apply every transform for `data_name` to `df`.
+    """
+    if data_name in DRAFT_IDS_DATA_NAMES_VALUES:
+        df = _create_draft_id(data_name, df)
+    df = _clean_IDs(data_name, df)
     return df
 
 
@@ -490,10 +2424,19 @@ def _clean_IDs(data_name: DATA_NAMES, df: pandas.DataFrame) -> pandas.DataFrame:
 
 
 def load(
-    data_name: DATA_NAMES, years: list[int] | None = None, update: bool = False
-) -> pandas.DataFrame:
+    data_name: DATA_NAMES,
+    years: list[int] | None = None,
+    update: bool = False,
+    workers: int = 1,
+    columns: list | None = None,
+    filters: list | None = None,
+    backend: BACKENDS = "pandas",
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+) -> "pandas.DataFrame | pyarrow.Table | polars.LazyFrame":
     """
-    Load NFL data from `nfl_data_py` or cache if it exists
+    Load NFL data from the source (`nfl_data_py` by default, see `set_source()`) or cache if it exists
 
     Parameters
     ----------
@@ -512,24 +2455,444 @@ def load(
         * `schedule`
 
     update : bool = False
-        Whether or not to update the data in the cache.
+        Whether or not to update the data in the cache. The latest cached season is fetched again, but only the weeks whose data changed are rewritten.
+
+    workers : int = 1
+        Maximum number of seasons to download and cache concurrently. Only used for `years` data functions.
+
+    columns : list | None = None
+        Columns to load, given as header strings or `cols` classes (e.g. `cols.pbp.Epa`). Only these columns are read from the cache. `None` loads all columns.
+
+    filters : list | None = None
+        Row filters as `(column, op, value)` tuples, e.g. `[("week", ">=", 10), ("posteam", "==", "KC")]`. `op` is one of `==`, `!=`, `<`, `<=`, `>`, `>=`, `in` or `not in`. A list of tuples keeps rows matching all predicates; a list of lists of tuples keeps rows matching any inner list. Filters are evaluated against the cached data, so row groups that cannot match are skipped. `None` loads all rows.
+
+    backend : {"pandas", "arrow", "polars"} = "pandas"
+        Type of the data returned. `arrow` returns a `pyarrow.Table` read straight from the cache without converting through pandas, chunked by cached file. `polars` returns a `polars.LazyFrame` over the cache; projections, filters and aggregations added to it are optimised by polars and only the columns and rows they need are read. Its seasons are not evicted by this process while the frame is alive, but another process sharing the cache may evict them once they haven't been read for `EVICTION_GRACE` seconds, so collect it before then. Requires the optional `polars` dependency.
+
+    compact : bool = False
+        Whether or not to return columns in the compact types they are cached in (see `cols.pbp_types`), instead of their original types. `pbp` indicator and small integer columns are `int8` / `int16` (nullable `Int8` / `Int16` with pandas), team and other low-cardinality string columns are categorical, and other float columns are `float32` if their values fit it exactly.
+
+    id_encoding : {"str", "int", "dictionary"} = "str"
+        How to return ID columns. `int` returns them as `int32` codes (nullable `Int32` with pandas), `dictionary` as dictionary-encoded columns (categorical with pandas, `Enum` with polars) whose codes are the same. Columns holding the same kind of ID share codes across datasets and loads, e.g. every `pbp` player ID column and `roster` `player_id` are `gsis_id` codes, so joins and group-bys on them work on integers. Codes are decoded with `id_dictionary()`. Filters still compare ID columns to string IDs.
+
+    canonical_teams : bool = False
+        Whether or not to map team columns (e.g. `posteam`, `home_team`, `draft_club`) to canonical abbreviations, so that abbreviations that changed across eras (`ARZ` / `ARI`, `BLT` / `BAL`, `GB` / `GNB`, ...) match. Team columns of every dataset are returned with the same fixed categories, see `team_dtype()` (an `int8` dictionary with arrow, `Enum` with polars), so joins and group-bys by team work on integer codes. Unknown abbreviations become missing. Filters still compare team columns to the cached abbreviations.
 
     Returns
     -------
 
-    out : pandas.DataFrame
+    out : pandas.DataFrame | pyarrow.Table | polars.LazyFrame
 
     """
     _load_validate_data_name(data_name)
     _load_validate_years(years)
     _load_validate_update(update)
-    mdata = _load_metadata(data_name)
+    _load_validate_workers(workers)
+    _load_validate_columns(columns)
+    _load_validate_filters(filters)
+    _load_validate_backend(backend)
+    _load_validate_compact(compact)
+    _load_validate_id_encoding(id_encoding)
+    _load_validate_canonical_teams(canonical_teams)
+    filters = _filter_headers(filters)
+    if columns is not None:
+        columns = [_column_header(column) for column in columns]
+    frozen = map(memcache.freeze, (years, columns, filters))
+    # Frames depend on the cache they were read from, so it is part of the key.
+    cache = (CONFIG_DATA["cache_dir"], _cache_format())
+    key = (data_name, *cache, *frozen, backend, compact, id_encoding, canonical_teams)
+    if update:
+        FRAME_CACHE.invalidate(data_name)
+    elif FRAME_CACHE.max_bytes > 0 and backend != "polars":
+        df = FRAME_CACHE.get(key)
+        if df is not None:
+            return df
+    _migrate_cache(data_name)
     df = pandas.DataFrame()
     if years:
-        df = _load_years(data_name, years, update, mdata)
+        df = _load_years(
+            data_name,
+            years,
+            update,
+            workers,
+            columns,
+            filters,
+            backend,
+            compact,
+            id_encoding,
+            canonical_teams,
+        )
     else:
-        df = _load_non_years(data_name, update, mdata)
-    if data_name in DRAFT_IDS_DATA_NAMES_VALUES:
-        df = _create_draft_id(data_name, df)
-    df = _clean_IDs(data_name, df)
+        df = _load_non_years(
+            data_name,
+            update,
+            columns,
+            filters,
+            backend,
+            compact,
+            id_encoding,
+            canonical_teams,
+        )
+    if backend != "polars":
+        FRAME_CACHE.put(key, df)
     return df
+
+
+def prefetch(
+    data_name: DATA_NAMES,
+    years: list[int] | None = None,
+    update: bool = False,
+    workers: int = 1,
+) -> list[int | None]:
+    """
+    Fill the cache for `data_name` without loading any data from it. Seasons already cached in the current format and by the current transforms are skipped.
+
+    Parameters
+    ----------
+
+    data_name : {"pbp", "draft", "roster", "player", "schedule", "map"}
+        `data_name` of the dataset to cache.
+
+    years : list[int] | None = None
+        Years to cache, see `load()`.
+
+    update : bool = False
+        Whether or not to update the data in the cache, see `load()`.
+
+    workers : int = 1
+        Maximum number of seasons to download and cache concurrently.
+
+    Returns
+    -------
+
+    out : list[int | None]
+        Years that were fetched or rebuilt. `[None]` if non-years data was fetched or rebuilt.
+    """
+    _load_validate_data_name(data_name)
+    _load_validate_years(years)
+    _load_validate_update(update)
+    _load_validate_workers(workers)
+    if update:
+        FRAME_CACHE.invalidate(data_name)
+    _migrate_cache(data_name)
+    if years:
+        return _update_years(data_name, years, update, workers)
+    elif _update_non_years(data_name, update):
+        return [None]
+    else:
+        return []
+
+
+# ========================
+# Streaming Load Functions
+# ========================
+
+# load_iter() yields bounded-size frames straight from the cache so that jobs
+# over the full history of a dataset run in constant memory.
+
+
+CHUNKS = typing.Literal["season", "week"]
+CHUNK_VALUES = {"season", "week"}
+
+
+def _iter_cached(
+    data_name: DATA_NAMES,
+    years: list[int],
+    chunk: CHUNKS,
+    rows: int | None,
+    columns: list[str] | None,
+    filters: list | None,
+    backend: BACKENDS,
+    compact: bool,
+    id_encoding: ID_ENCODINGS,
+    canonical_teams: bool,
+    cached: set[int],
+) -> typing.Iterator[pandas.DataFrame | pyarrow.Table]:
+    """
+    Iterate over the cached data for `years` of `data_name` in chunks. Empty chunks are skipped. ID and team columns are converted like `_load_cached_table()`. The seasons are registered as being read until the iterator is exhausted or closed. Raises `FileNotFoundError` if a season in `cached` has been removed from the cache by the time it is read.
+    """
+    with _reading_seasons(data_name, years):
+        yield from _iter_seasons(
+            data_name,
+            years,
+            chunk,
+            rows,
+            columns,
+            filters,
+            backend,
+            compact,
+            id_encoding,
+            canonical_teams,
+            cached,
+        )
+
+
+def _iter_seasons(
+    data_name: DATA_NAMES,
+    years: list[int],
+    chunk: CHUNKS,
+    rows: int | None,
+    columns: list[str] | None,
+    filters: list | None,
+    backend: BACKENDS,
+    compact: bool,
+    id_encoding: ID_ENCODINGS,
+    canonical_teams: bool,
+    cached: set[int],
+) -> typing.Iterator[pandas.DataFrame | pyarrow.Table]:
+    expression = _filter_expression(filters)
+
+    def convert(table: pyarrow.Table | pyarrow.RecordBatch):
+        if isinstance(table, pyarrow.RecordBatch):
+            table = pyarrow.Table.from_batches([table])
+        if not compact:
+            table = _restore_table(table)
+        table = _encode_IDs(data_name, table, id_encoding)
+        if canonical_teams:
+            table = _canonicalize_teams(data_name, table)
+        if backend == "polars":
+            return _import_polars().from_arrow(table)
+        elif backend == "arrow":
+            return table
+        return _table_to_pandas(table, compact)
+
+    for year in years:
+        fragments = _season_fragments(data_name, year)
+        if not fragments and year in cached:
+            raise FileNotFoundError(
+                f"Season {year} of {data_name} was removed from the cache while it was being read."
+            )
+        elif not fragments:
+            continue
+        if rows is not None:
+            dataset = _cached_dataset(fragments)
+            for batch in dataset.to_batches(
+                columns=columns, filter=expression, batch_size=rows
+            ):
+                if batch.num_rows > 0:
+                    yield convert(batch)
+        elif chunk == "week":
+            for fragment in fragments:
+                dataset = _cached_dataset([fragment])
+                table = dataset.to_table(columns=columns, filter=expression)
+                if table.num_rows > 0:
+                    yield convert(table)
+        elif backend != "pandas":
+            table = _load_cached_table(data_name, [year], columns, filters, True)
+            if table.num_rows > 0:
+                yield convert(table)
+        else:
+            df = _load_cached(
+                data_name,
+                [year],
+                columns,
+                filters,
+                compact,
+                id_encoding,
+                canonical_teams,
+            )
+            if len(df.index) > 0:
+                yield df
+
+
+def load_iter(
+    data_name: DATA_NAMES,
+    years: list[int],
+    chunk: CHUNKS = "season",
+    rows: int | None = None,
+    update: bool = False,
+    workers: int = 1,
+    columns: list | None = None,
+    filters: list | None = None,
+    backend: BACKENDS = "pandas",
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+) -> typing.Iterator[pandas.DataFrame | pyarrow.Table]:
+    """
+    Load NFL data as an iterator of chunks, reading one chunk from the cache at a time. Any missing years are fetched before the iterator is returned.
+
+    Parameters
+    ----------
+
+    data_name : {"pbp", "draft", "roster", "schedule"}
+        `data_name` of the dataset to get.
+
+    years : list[int]
+        List of integers for the years to get the data for.
+
+    chunk : {"season", "week"} = "season"
+        Yield one frame per season or one frame per week. `draft` has no weeks, so `week` chunks are whole seasons.
+
+    rows : int | None = None
+        If given, yield frames of at most `rows` rows instead of `chunk` sized frames.
+
+    update : bool = False
+        Whether or not to update the data in the cache. The latest cached season is fetched again, but only the weeks whose data changed are rewritten.
+
+    workers : int = 1
+        Maximum number of seasons to download and cache concurrently.
+
+    columns : list | None = None
+        Columns to load, see `load()`.
+
+    filters : list | None = None
+        Row filters, see `load()`.
+
+    backend : {"pandas", "arrow", "polars"} = "pandas"
+        Type of the chunks yielded, see `load()`. `polars` yields `polars.DataFrame` chunks.
+
+    compact : bool = False
+        Whether or not to yield columns in their compact cached types, see `load()`.
+
+    id_encoding : {"str", "int", "dictionary"} = "str"
+        How to yield ID columns, see `load()`. Codes are the same in every chunk.
+
+    canonical_teams : bool = False
+        Whether or not to map team columns to canonical abbreviations, see `load()`.
+
+    Returns
+    -------
+
+    out : Iterator[pandas.DataFrame | pyarrow.Table | polars.DataFrame]
+        Frames in year order, then week order.
+    """
+    _load_validate_data_name(data_name)
+    if data_name not in YEARS_DATA_NAMES:
+        raise ValueError("data_name argument passed to load_iter() invalid.")
+    _load_validate_years(years)
+    if not years:
+        raise ValueError("years argument passed to load_iter() invalid.")
+    _load_validate_chunk(chunk, rows)
+    _load_validate_update(update)
+    _load_validate_workers(workers)
+    _load_validate_columns(columns)
+    _load_validate_filters(filters)
+    _load_validate_backend(backend)
+    _load_validate_compact(compact)
+    _load_validate_id_encoding(id_encoding)
+    _load_validate_canonical_teams(canonical_teams)
+    filters = _filter_headers(filters)
+    if columns is not None:
+        columns = [_column_header(column) for column in columns]
+    if update:
+        FRAME_CACHE.invalidate(data_name)
+    _migrate_cache(data_name)
+    _update_years(data_name, years, update, workers)
+    cache_catalog = _catalog()
+    cache_catalog.touch(data_name, years)
+    cached = set(cache_catalog.seasons(data_name))
+    return _iter_cached(
+        data_name,
+        years,
+        chunk,
+        rows,
+        columns,
+        filters,
+        backend,
+        compact,
+        id_encoding,
+        canonical_teams,
+        cached,
+    )
+
+
+# ======================
+# Asyncio Load Functions
+# ======================
+
+# load() blocks while it fetches and decodes data, so the asyncio functions run
+# it in an executor. Concurrent loads of the same missing season share a single
+# fetch, see `SEASON_FLIGHTS`.
+
+
+async def load_async(
+    data_name: DATA_NAMES,
+    years: list[int] | None = None,
+    update: bool = False,
+    workers: int = 1,
+    columns: list | None = None,
+    filters: list | None = None,
+    backend: BACKENDS = "pandas",
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+    executor: concurrent.futures.Executor | None = None,
+) -> "pandas.DataFrame | pyarrow.Table | polars.LazyFrame":
+    """
+    Load NFL data without blocking the event loop. Takes the same arguments as `load()`.
+
+    Parameters
+    ----------
+
+    executor : concurrent.futures.Executor | None = None
+        Executor to run `load()` in. `None` uses the default executor of the running event loop.
+
+    Returns
+    -------
+
+    out : pandas.DataFrame | pyarrow.Table | polars.LazyFrame
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(
+        load,
+        data_name,
+        years,
+        update,
+        workers,
+        columns,
+        filters,
+        backend,
+        compact,
+        id_encoding,
+        canonical_teams,
+    )
+    return await loop.run_in_executor(executor, call)
+
+
+async def load_many_async(
+    requests: dict[DATA_NAMES, list[int] | None],
+    update: bool = False,
+    workers: int = 1,
+    backend: BACKENDS = "pandas",
+    compact: bool = False,
+    id_encoding: ID_ENCODINGS = "str",
+    canonical_teams: bool = False,
+    executor: concurrent.futures.Executor | None = None,
+) -> dict[DATA_NAMES, "pandas.DataFrame | pyarrow.Table | polars.LazyFrame"]:
+    """
+    Load several datasets concurrently without blocking the event loop, e.g. `await load_many_async({"pbp": [2023], "roster": [2023], "player": None})`.
+
+    Parameters
+    ----------
+
+    requests : dict[str, list[int] | None]
+        `years` to load for each `data_name`, see `load()`.
+
+    update, workers, backend, compact, id_encoding, canonical_teams, executor
+        See `load_async()`. Used for every dataset.
+
+    Returns
+    -------
+
+    out : dict[str, pandas.DataFrame | pyarrow.Table | polars.LazyFrame]
+        Data for each `data_name` in `requests`.
+    """
+    data_names = list(requests)
+    results = await asyncio.gather(
+        *(
+            load_async(
+                data_name,
+                requests[data_name],
+                update,
+                workers,
+                backend=backend,
+                compact=compact,
+                id_encoding=id_encoding,
+                canonical_teams=canonical_teams,
+                executor=executor,
+            )
+            for data_name in data_names
+        )
+    )
+    return dict(zip(data_names, results))
@@ -70,7 +70,7 @@ class PlayerMap(IDMap):
                 self.metadata[data_name][year] = True
                 years.append(year)
         map_columns = list(set(ID_COLUMNS[data_name].keys()).intersection(MAP_COLUMNS))
-        df = load(data_name, years, True)[map_columns]
+        df = load(data_name, years, True, columns=map_columns)
         df = _correct_id_alias(data_name, df)
         pbar.update()
         self.append(df, pbar)
@@ -80,7 +80,7 @@ class PlayerMap(IDMap):
         Update the map with data from non-years functions.
         """
         map_columns = list(set(ID_COLUMNS[data_name].keys()).intersection(MAP_COLUMNS))
-        df = load(data_name, update=True)[map_columns]
+        df = load(data_name, update=True, columns=map_columns)
         df = _correct_id_alias(data_name, df)
         pbar.update()
         self.append(df, pbar)
@@ -0,0 +1,166 @@
+import abc
+import os
+import threading
+import typing
+import pandas
+import pyarrow
+import pyarrow.compute
+import pyarrow.csv
+import pyarrow.parquet
+
+
+# ===========
+# Source Base
+# ===========
+
+
+class Source(abc.ABC):
+    """
+    Where `load()` fetches NFL data that is not cached yet. Subclasses implement `fetch()`.
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Name recorded in the cache catalog for the data fetched from this source. Sources that return the same data for every dataset share a name. Defaults to the class name.
+        """
+        return type(self).__name__
+
+    @abc.abstractmethod
+    def fetch(self, data_name: str, years: list[int] | None) -> pandas.DataFrame:
+        """
+        Fetch `years` of `data_name`, or all of it if `years` is `None` (non-years data).
+        """
+
+
+# ==================
+# nfl_data_py Source
+# ==================
+
+
+NFL_DATA_PY_FUNCS = {
+    "pbp": "import_pbp_data",
+    "draft": "import_draft_picks",
+    "roster": "import_weekly_rosters",
+    "player": "import_players",
+    "schedule": "import_schedules",
+    "map": "import_ids",
+}
+
+
+class NflDataPySource(Source):
+    """
+    Fetch NFL data from the nflverse over the network with `nfl_data_py`.
+    """
+
+    name = "nfl_data_py"
+
+    def __init__(self, funcs: dict[str, str | typing.Callable] | None = None):
+        """
+        Parameters
+        ----------
+
+        funcs : dict[str, str | Callable] | None = None
+            `nfl_data_py` function, or its name, for each `data_name`. Names are imported on first use since importing `nfl_data_py` is slow. `None` uses `NFL_DATA_PY_FUNCS`.
+        """
+        self.funcs = dict(NFL_DATA_PY_FUNCS) if funcs is None else funcs
+
+    def func(self, data_name: str) -> typing.Callable[..., pandas.DataFrame]:
+        func = self.funcs[data_name]
+        if isinstance(func, str):
+            import nfl_data_py
+
+            func = getattr(nfl_data_py, func)
+        return func
+
+    def fetch(self, data_name: str, years: list[int] | None) -> pandas.DataFrame:
+        if years is None:
+            return self.func(data_name)()
+        return self.func(data_name)(years)
+
+
+# =============
+# Mirror Source
+# =============
+
+# A mirror is a local directory of nflverse release files, e.g. downloaded with
+# `gh release download` from nflverse/nflverse-data. Files are looked up by the
+# stem of their release name and may be parquet or (gzipped) csv:
+#
+#   <mirror>/play_by_play_2023.parquet
+#   <mirror>/roster_weekly_2023.parquet
+#   <mirror>/draft_picks.parquet
+#   <mirror>/games.csv
+
+
+MIRROR_FILES = {
+    "pbp": "play_by_play_{year}",
+    "roster": "roster_weekly_{year}",
+    "draft": "draft_picks",
+    "schedule": "games",
+    "player": "players",
+    "map": "db_playerids",
+}
+MIRROR_EXTENSIONS = [".parquet", ".csv", ".csv.gz"]
+
+
+class MirrorSource(Source):
+    """
+    Fetch NFL data from a local mirror directory of nflverse release files, so caches can be filled without network access. Data is returned as published by the nflverse, without the post-processing `nfl_data_py` applies to some datasets (e.g. the `pbp` participation columns and the `roster` `age` column), so a dataset can't be cached from both.
+    """
+
+    name = "nflverse_mirror"
+
+    def __init__(self, path: str):
+        """
+        Parameters
+        ----------
+
+        path : str
+            Mirror directory.
+        """
+        if not os.path.isdir(path):
+            raise ValueError(f'Mirror directory "{path}" does not exist.')
+        self.path = path
+        self.tables = {}
+        self.lock = threading.Lock()
+
+    def file_path(self, data_name: str, year: int | None = None) -> str:
+        """
+        Get the path of the mirror file holding `year` of `data_name`. Raises `FileNotFoundError` if the mirror has no such file.
+        """
+        stem = MIRROR_FILES[data_name].format(year=year)
+        for extension in MIRROR_EXTENSIONS:
+            path = os.path.join(self.path, stem + extension)
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f'No file "{stem}" for {data_name} in "{self.path}".')
+
+    def read(self, path: str) -> pyarrow.Table:
+        """
+        Read the mirror file at `path`.
+        """
+        if path.endswith(".parquet"):
+            return pyarrow.parquet.ParquetFile(path).read()
+        return pyarrow.csv.read_csv(path)
+
+    def read_all_years(self, path: str) -> pyarrow.Table:
+        """
+        Read the mirror file at `path` holding every season of a dataset. The table of each file is kept in memory until the file changes, since `load()` fetches one season at a time.
+        """
+        mtime = os.path.getmtime(path)
+        with self.lock:
+            if path not in self.tables or self.tables[path][0] != mtime:
+                self.tables[path] = (mtime, self.read(path))
+            return self.tables[path][1]
+
+    def fetch(self, data_name: str, years: list[int] | None) -> pandas.DataFrame:
+        if years is None:
+            return self.read(self.file_path(data_name)).to_pandas()
+        if "{year}" not in MIRROR_FILES[data_name]:
+            table = self.read_all_years(self.file_path(data_name))
+            mask = pyarrow.compute.is_in(table["season"], pyarrow.array(years))
+            return table.filter(mask).to_pandas()
+        tables = [self.read(self.file_path(data_name, year)) for year in years]
+        table = pyarrow.concat_tables(tables, promote_options="permissive")
+        return table.to_pandas()
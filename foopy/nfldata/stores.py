@@ -0,0 +1,157 @@
+import abc
+import os
+import threading
+
+
+# ==========
+# Store Base
+# ==========
+
+
+class Store(abc.ABC):
+    """
+    Key-value storage for cache files shared between machines. Keys are `/` separated paths relative to the root of the store. Subclasses implement `read()`, `write()`, `exists()` and `delete()`.
+    """
+
+    @abc.abstractmethod
+    def read(self, key: str) -> bytes:
+        """
+        Read the file at `key`. Raises `FileNotFoundError` if there is none.
+        """
+
+    @abc.abstractmethod
+    def write(self, key: str, data: bytes):
+        """
+        Write `data` to the file at `key`, replacing it atomically if it exists.
+        """
+
+    @abc.abstractmethod
+    def exists(self, key: str) -> bool:
+        """
+        Whether or not there is a file at `key`.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """
+        Delete the file at `key`, if any.
+        """
+
+
+# ===========
+# Local Store
+# ===========
+
+
+class LocalStore(Store):
+    """
+    Store in a local directory, e.g. a mounted network share.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def read(self, key: str) -> bytes:
+        with open(self._path(key), "rb") as file:
+            return file.read()
+
+    def write(self, key: str, data: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def delete(self, key: str):
+        if self.exists(key):
+            os.remove(self._path(key))
+
+
+# ============
+# Memory Store
+# ============
+
+
+class MemoryStore(Store):
+    """
+    Store in memory, shared by everything in the process holding it. Intended for tests.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.lock = threading.Lock()
+
+    def read(self, key: str) -> bytes:
+        with self.lock:
+            if key not in self.files:
+                raise FileNotFoundError(key)
+            return self.files[key]
+
+    def write(self, key: str, data: bytes):
+        with self.lock:
+            self.files[key] = bytes(data)
+
+    def exists(self, key: str) -> bool:
+        with self.lock:
+            return key in self.files
+
+    def delete(self, key: str):
+        with self.lock:
+            self.files.pop(key, None)
+
+
+# ============
+# fsspec Store
+# ============
+
+
+class FsspecStore(Store):
+    """
+    Store on any filesystem supported by `fsspec`, e.g. `s3://bucket/foopy` or `gcs://bucket/foopy`. Requires `fsspec` and the package for the protocol (e.g. `s3fs`).
+    """
+
+    def __init__(self, url: str, **storage_options):
+        """
+        Parameters
+        ----------
+
+        url : str
+            Root of the store.
+
+        **storage_options
+            Passed to the `fsspec` filesystem, e.g. credentials.
+        """
+        try:
+            import fsspec.core
+        except ImportError as error:
+            raise ImportError(
+                'FsspecStore requires fsspec: pip install "foopy[fsspec]"'
+            ) from error
+        self.fs, self.root = fsspec.core.url_to_fs(url, **storage_options)
+
+    def _path(self, key: str) -> str:
+        return self.root.rstrip("/") + "/" + key
+
+    def read(self, key: str) -> bytes:
+        return self.fs.cat_file(self._path(key))
+
+    def write(self, key: str, data: bytes):
+        # Object stores replace objects atomically. Use `LocalStore` for local
+        # and network filesystems, which writes through a temporary file.
+        path = self._path(key)
+        self.fs.makedirs(path.rsplit("/", 1)[0], exist_ok=True)
+        self.fs.pipe_file(path, data)
+
+    def exists(self, key: str) -> bool:
+        return self.fs.exists(self._path(key))
+
+    def delete(self, key: str):
+        if self.exists(key):
+            self.fs.rm_file(self._path(key))
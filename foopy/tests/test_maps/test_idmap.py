@@ -39,3 +39,41 @@ def test_append():
     map.append(append2)
     assert map.df.equals(map_value)
     assert map.append_df.equals(append_value)
+
+
+def test_maptize_conflicts():
+    idmap = IDMap()
+    idmap.append(
+        pandas.DataFrame(
+            {
+                "A": ["1", "1", None, "3", "4"],
+                "B": [None, "1", "1", "2", "2"],
+                "C": ["1", None, "1", None, None],
+            }
+        )
+    )
+    idmap.maptize(["A", "B"])
+    assert idmap.df.iloc[0].tolist() == ["1", "1", "1"]
+    assert len(idmap.df.index) == 3
+    assert idmap.conflicts["A"].tolist() == ["3", "4"]
+    assert idmap.conflicts["conflict_column"].tolist() == ["B", "B"]
+    assert idmap.conflicts["conflict"].nunique() == 1
+    # Rows sharing a draft ID, which is not unique, still merge by game ID.
+    idmap = IDMap()
+    idmap.append(
+        pandas.DataFrame(
+            {
+                "gsis_id": ["G1", "G1", "G2"],
+                "pfr_id": ["P1", None, "P2"],
+                "esb_id": [None, "E1", None],
+                "draft_id": ["D", None, "D"],
+            }
+        )
+    )
+    idmap.maptize(["gsis_id", "pfr_id", "esb_id", "draft_id"])
+    assert idmap.df.fillna("-").values.tolist() == [
+        ["G1", "P1", "E1", "D"],
+        ["G2", "P2", "-", "D"],
+    ]
+    assert idmap.conflicts["gsis_id"].tolist() == ["G1", "G2"]
+    assert idmap.conflicts["conflict_column"].unique().tolist() == ["draft_id"]
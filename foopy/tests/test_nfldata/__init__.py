@@ -0,0 +1 @@
+from .fake_data import FakeSource, fake_schedule, fake_roster, fake_pbp
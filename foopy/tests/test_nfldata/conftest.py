@@ -0,0 +1,16 @@
+from ...nfldata import nfldata
+from .fake_data import FakeSource, fake_schedule, fake_roster, fake_pbp
+import pytest
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.setitem(nfldata.CONFIG_DATA, "cache_dir", str(tmp_path) + "/")
+    sources = {
+        "schedule": FakeSource(fake_schedule),
+        "roster": FakeSource(fake_roster),
+        "pbp": FakeSource(fake_pbp),
+    }
+    for data_name, source in sources.items():
+        monkeypatch.setitem(nfldata.NFL_DATA_FUNCS, data_name, source)
+    return sources
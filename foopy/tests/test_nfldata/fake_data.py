@@ -0,0 +1,121 @@
+import pandas
+import threading
+
+
+# ===================
+# Fake NFL Data Frames
+# ===================
+
+# Small stand-ins for the frames returned by `nfl_data_py`, used so the cache
+# layer can be tested without network access.
+
+
+TEAMS = ["KC", "BUF", "GB", "ARI"]
+
+
+def fake_schedule(years: list[int]) -> pandas.DataFrame:
+    """
+    Create a fake schedule frame with two games per week for weeks 1 - 3 of each year.
+    """
+    rows = []
+    for year in years:
+        for week in range(1, 4):
+            for game in range(2):
+                home = TEAMS[(week + game) % len(TEAMS)]
+                away = TEAMS[(week + game + 1) % len(TEAMS)]
+                rows.append(
+                    {
+                        "game_id": f"{year}_{week:02d}_{away}_{home}",
+                        "season": year,
+                        "week": week,
+                        "home_team": home,
+                        "away_team": away,
+                        "home_score": float(week * 7 + game),
+                        "away_score": float(week * 3),
+                        "old_game_id": float(year * 1000000 + week * 100 + game),
+                        "nfl_detail_id": None,
+                        "away_qb_id": f"00-00{year}{game}",
+                        "home_qb_id": f"00-00{year}{week}",
+                        "stadium_id": "KAN00",
+                    }
+                )
+    return pandas.DataFrame(rows)
+
+
+def fake_roster(years: list[int]) -> pandas.DataFrame:
+    """
+    Create a fake weekly roster frame with two players for weeks 1 - 3 of each year.
+    """
+    rows = []
+    for year in years:
+        for week in range(1, 4):
+            for number, (name, club, pick) in enumerate(
+                [("Patrick Mahomes", "KC", 10.0), ("Ja'Marr Chase", "CIN", None)]
+            ):
+                rows.append(
+                    {
+                        "season": year,
+                        "week": week,
+                        "team": club,
+                        "player_name": name,
+                        "draft_club": club,
+                        "draft_number": pick,
+                        "player_id": f"00-003{number}",
+                        "espn_id": float(3139477 + number),
+                        "sportradar_id": None,
+                        "yahoo_id": float(30123 + number),
+                        "rotowire_id": None,
+                        "pff_id": float(11765 + number),
+                        "pfr_id": f"MahoPa0{number}",
+                        "fantasy_data_id": None,
+                        "sleeper_id": float(4046 + number),
+                        "esb_id": f"MAH{number}",
+                        "gsis_it_id": float(45 + number),
+                        "smart_id": None,
+                    }
+                )
+    return pandas.DataFrame(rows)
+
+
+def fake_pbp(years: list[int]) -> pandas.DataFrame:
+    """
+    Create a fake play-by-play frame with three plays for weeks 1 - 2 of each year.
+    """
+    rows = []
+    for year in years:
+        for week in range(1, 3):
+            for play in range(3):
+                rows.append(
+                    {
+                        "play_id": float(play * 20 + 1),
+                        "game_id": f"{year}_{week:02d}_KC_BUF",
+                        "season": year,
+                        "week": week,
+                        "posteam": TEAMS[play % 2],
+                        "passer_player_id": ["00-0033873", "", None][play],
+                        "defteam": TEAMS[(play + 1) % 2],
+                        "down": float(play + 1) if play < 2 else None,
+                        "shotgun": float(play % 2),
+                        "yards_gained": float(play * 4 - 2),
+                        "air_yards": 7.5,
+                        "epa": 0.25 * play - 0.1,
+                        "desc": f"Play {play}",
+                    }
+                )
+    return pandas.DataFrame(rows)
+
+
+class FakeSource:
+    """
+    Callable stand-in for an `nfl_data_py` years function that counts calls.
+    """
+
+    def __init__(self, create):
+        self.create = create
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, years: list[int]) -> pandas.DataFrame:
+        with self.lock:
+            self.calls.append(list(years))
+        return self.create(years)
@@ -0,0 +1,21 @@
+from ... import cli
+from ...nfldata import nfldata
+import pytest
+
+
+def test_parse_seasons():
+    assert cli._parse_seasons("2002-2004,2010,2003") == [2002, 2003, 2004, 2010]
+
+
+def test_cache_warm(sources, capsys):
+    nfldata.load("schedule", [2019])
+    argv = ["cache", "warm", "--datasets", "schedule,roster"]
+    assert cli.main(argv + ["--seasons", "2019-2020", "--jobs", "3"]) == 0
+    assert sorted(sources["schedule"].calls) == [[2019], [2020]]
+    assert sorted(sources["roster"].calls) == [[2019], [2020]]
+    lines = capsys.readouterr().out.splitlines()
+    assert sum("cached" in line for line in lines[:-1]) == 1
+    assert sum("fetched" in line for line in lines[:-1]) == 3
+    assert lines[-1].startswith("4 partitions (3 fetched, 1 cached, 0 failed)")
+    with pytest.raises(SystemExit):
+        cli.main(["cache", "warm", "--datasets", "bogus", "--seasons", "2019"])
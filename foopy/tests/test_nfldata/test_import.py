@@ -0,0 +1,40 @@
+import foopy
+import os
+import subprocess
+import sys
+
+
+# Budget for `import foopy.nfldata` in a fresh interpreter, in seconds. Eager
+# imports of pandas and `nfl_data_py` take well over half a second.
+IMPORT_BUDGET = 0.1
+
+HEAVY_MODULES = ["pandas", "pyarrow", "nfl_data_py", "foopy.nfldata.cols.pbp"]
+
+IMPORT_CODE = f"""
+import sys
+import time
+start = time.perf_counter()
+import foopy.nfldata
+print(time.perf_counter() - start)
+print(",".join(module for module in {HEAVY_MODULES!r} if module in sys.modules))
+foopy.nfldata.load
+print(",".join(module for module in {HEAVY_MODULES!r} if module in sys.modules))
+"""
+
+
+def _run_import() -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CODE],
+        cwd=os.path.dirname(os.path.dirname(foopy.__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.splitlines()
+
+
+def test_import_time():
+    runs = [_run_import() for _ in range(3)]
+    assert min(float(run[0]) for run in runs) < IMPORT_BUDGET
+    assert runs[0][1] == ""
+    assert runs[0][2] == "pandas,pyarrow"
@@ -0,0 +1,457 @@
+from ...nfldata import nfldata, cols
+from .fake_data import FakeSource, fake_schedule, fake_pbp
+import asyncio
+import gc
+import time
+import multiprocessing
+import os
+import pandas
+import pyarrow
+import pytest
+
+
+def test_load_years_parallel(sources):
+    years = [2021, 2019, 2020]
+    df = nfldata.load("schedule", years, workers=3)
+    assert df["season"].unique().tolist() == years
+    assert sorted(sources["schedule"].calls) == [[2019], [2020], [2021]]
+    assert nfldata._catalog().seasons("schedule") == {2019, 2020, 2021}
+
+
+def test_load_years_cached(sources):
+    nfldata.load("schedule", [2019, 2020])
+    df = nfldata.load("schedule", [2020, 2019])
+    assert len(sources["schedule"].calls) == 2
+    assert df["season"].unique().tolist() == [2020, 2019]
+    nfldata.load("schedule", [2019, 2020], update=True)
+    assert sources["schedule"].calls[-1] == [2020]
+
+
+def test_load_validate_workers(sources):
+    with pytest.raises(ValueError):
+        nfldata.load("schedule", [2019], workers=0)
+
+
+def test_load_columns(sources):
+    full = nfldata.load("roster", [2020])
+    df = nfldata.load("roster", [2020], columns=[cols.roster.PlayerId, "draft_id"])
+    assert df.columns.tolist() == ["player_id", "draft_id"]
+    assert df.equals(full[["player_id", "draft_id"]])
+    assert df["draft_id"].iloc[0] == "KAN10PatrickMahomes"
+
+
+def test_load_filters(sources):
+    full = nfldata.load("schedule", [2019, 2020])
+    filters = [(cols.schedule.Week, ">=", 2), ("home_team", "in", {"KC", "GB"})]
+    df = nfldata.load("schedule", [2019, 2020], filters=filters)
+    expected = full[(full["week"] >= 2) & full["home_team"].isin(["KC", "GB"])]
+    assert df.reset_index(drop=True).equals(expected.reset_index(drop=True))
+    with pytest.raises(ValueError):
+        nfldata.load("schedule", [2019], filters=[("week", "~", 2)])
+
+
+def test_load_partitioned(sources, tmp_path):
+    nfldata.load("schedule", [2019])
+    assert (tmp_path / "schedule/season=2019/week=3/part-0.parquet").exists()
+    fake_schedule([2020]).to_parquet(tmp_path / "schedule-2020.parq")
+    df = nfldata.load("schedule", [2019, 2020], filters=[("week", "==", 2)])
+    assert not (tmp_path / "schedule-2020.parq").exists()
+    assert (tmp_path / "schedule/season=2020/week=2/part-0.parquet").exists()
+    assert len(sources["schedule"].calls) == 1
+    assert df["season"].tolist() == [2019, 2019, 2020, 2020]
+
+
+def test_cache_info(sources, tmp_path):
+    nfldata.load("schedule", [2019, 2020], workers=2)
+    info = nfldata.cache_info("schedule")
+    assert info["path"].tolist()[0] == "schedule/season=2019/week=1/part-0.parquet"
+    assert info.groupby("season")["rows"].sum().to_dict() == {2019: 6, 2020: 6}
+    assert info["schema_hash"].nunique() == 1
+
+
+def test_migrate_metadata(sources, tmp_path):
+    fake_schedule([2019]).to_parquet(tmp_path / "schedule-2019.parq")
+    (tmp_path / "metadata.json").write_text('{"schedule": {"2019": true}}')
+    nfldata.load("schedule", [2019])
+    assert not (tmp_path / "metadata.json").exists()
+    assert sources["schedule"].calls == []
+    assert nfldata.cache_info()["season"].unique().tolist() == [2019]
+
+
+def test_transform_version(sources, monkeypatch):
+    nfldata.load("roster", [2020])
+    transforms = []
+    transform = nfldata._transform
+    monkeypatch.setattr(
+        nfldata, "_transform", lambda *args: transforms.append(1) or transform(*args)
+    )
+    df = nfldata.load("roster", [2020], filters=[("draft_id", "!=", "")])
+    assert transforms == []
+    assert df["draft_id"].unique().tolist() == ["KAN10PatrickMahomes"]
+    monkeypatch.setattr(nfldata, "TRANSFORM_VERSION", nfldata.TRANSFORM_VERSION + 1)
+    assert nfldata.load("roster", [2020])["espn_id"].iloc[0] == "3139477"
+    assert transforms == [1]
+    assert len(sources["roster"].calls) == 1
+    stale = nfldata._catalog().stale_seasons(
+        "roster", nfldata.TRANSFORM_VERSION, "parquet"
+    )
+    assert stale == set()
+
+
+def test_load_iter(sources):
+    full = nfldata.load("schedule", [2019, 2020], columns=["game_id", "week"])
+    chunks = nfldata.load_iter("schedule", [2019, 2020], columns=["game_id", "week"])
+    assert [len(chunk.index) for chunk in chunks] == [6, 6]
+    chunks = list(nfldata.load_iter("schedule", [2019, 2020], chunk="week"))
+    assert [chunk["week"].unique().tolist() for chunk in chunks] == [[1], [2], [3]] * 2
+    chunks = list(
+        nfldata.load_iter("schedule", [2019, 2020], rows=4, columns=["game_id"])
+    )
+    assert max(len(chunk.index) for chunk in chunks) <= 4
+    df = pandas.concat(chunks, ignore_index=True)
+    assert df["game_id"].tolist() == full["game_id"].tolist()
+
+
+def test_load_arrow(sources):
+    df = nfldata.load("roster", [2019, 2020], filters=[("week", "<", 3)])
+    table = nfldata.load(
+        "roster", [2019, 2020], filters=[("week", "<", 3)], backend="arrow"
+    )
+    assert isinstance(table, pyarrow.Table)
+    assert table.num_rows == len(df.index)
+    assert table.column("draft_id").to_pylist() == df["draft_id"].tolist()
+    chunks = nfldata.load_iter("roster", [2019], chunk="week", backend="arrow")
+    assert [chunk.num_rows for chunk in chunks] == [2, 2, 2]
+
+
+def test_load_polars(sources):
+    polars = pytest.importorskip("polars")
+    df = nfldata.load("schedule", [2019, 2020], filters=[("home_team", "in", {"KC"})])
+    lazy = nfldata.load(
+        "schedule",
+        [2019, 2020],
+        filters=[("home_team", "in", {"KC"})],
+        backend="polars",
+    )
+    assert isinstance(lazy, polars.LazyFrame)
+    result = lazy.group_by("season").agg(polars.len()).sort("season").collect()
+    assert result["len"].to_list() == df.groupby("season").size().tolist()
+
+
+def test_cache_format(sources, tmp_path, monkeypatch):
+    monkeypatch.setattr(nfldata, "_dump_config_data", lambda: None)
+    df = nfldata.load("roster", [2019, 2020])
+    monkeypatch.setitem(nfldata.CONFIG_DATA, "cache_format", "parquet")
+    nfldata.set_cache_format("arrow-ipc")
+    assert nfldata.load("roster", [2019, 2020]).equals(df)
+    assert (tmp_path / "roster/season=2019/week=1/part-0.arrow").exists()
+    assert not (tmp_path / "roster/season=2019/week=1/part-0.parquet").exists()
+    assert nfldata.cache_info("roster")["format"].unique().tolist() == ["arrow-ipc"]
+    table = nfldata.load("roster", [2020], filters=[("week", "==", 2)], backend="arrow")
+    assert table.column("player_id").to_pylist() == ["00-0030", "00-0031"]
+    assert len(sources["roster"].calls) == 2
+
+
+def test_load_compact(sources, tmp_path):
+    full = nfldata.load("pbp", [2019, 2020])
+    expected = fake_pbp([2019, 2020])
+    expected["play_id"] = expected["play_id"].astype(int).astype(str)
+    expected["passer_player_id"] = ["00-0033873", None, None] * 4
+    assert full.equals(expected)
+    schema = pyarrow.parquet.read_schema(
+        tmp_path / "pbp/season=2019/week=1/part-0.parquet"
+    )
+    assert schema.field("shotgun").type == pyarrow.int8()
+    assert schema.field("posteam").type == pyarrow.dictionary(
+        pyarrow.int32(), pyarrow.string()
+    )
+    assert schema.field("air_yards").type == pyarrow.float64()
+    assert schema.field("epa").type == pyarrow.float64()
+    df = nfldata.load("pbp", [2019, 2020], compact=True)
+    assert df["down"].dtype == "Int8"
+    assert df["yards_gained"].dtype == "Int16"
+    assert df["posteam"].dtype == "category"
+    assert df["epa"].dtype == "float64"
+    assert df["down"].isna().sum() == 4
+    table = nfldata.load("pbp", [2019], backend="arrow")
+    assert table.schema.field("posteam").type == pyarrow.string()
+    lazy = nfldata.load("pbp", [2019], backend="polars", compact=True)
+    assert str(lazy.collect_schema()["shotgun"]) == "Int8"
+    chunks = list(nfldata.load_iter("pbp", [2019], chunk="week", compact=True))
+    assert chunks[0]["posteam"].dtype == "category"
+
+
+def test_compact_float_lossless():
+    table = pyarrow.table(
+        {"exact": [0.5, None, float("nan")], "rounded": [0.1, 1.0, None]}
+    )
+    compact = nfldata._compact_table("pbp", table)
+    assert compact.schema.field("exact").type == pyarrow.float32()
+    assert compact.schema.field("rounded").type == pyarrow.float64()
+    restored = nfldata._restore_table(compact).to_pandas()
+    pandas.testing.assert_frame_equal(restored, table.to_pandas())
+
+
+def test_load_rounded_floats(sources, tmp_path):
+    nfldata.load("pbp", [2019])
+    path = tmp_path / "pbp/season=2019/week=1/part-0.parquet"
+    table = pyarrow.parquet.ParquetFile(path).read()
+    index = table.schema.get_field_index("epa")
+    field = table.field(index).with_type(pyarrow.float32())
+    field = field.with_metadata({nfldata.ORIGINAL_TYPE_KEY: b"double"})
+    table = table.set_column(index, field, table.column(index).cast(field.type))
+    pyarrow.parquet.write_table(table, path)
+    cache_catalog = nfldata._catalog()
+    entries = [
+        dict(entry, path=str(tmp_path / entry["path"]), transform_version=4)
+        for entry in cache_catalog.season_entries("pbp", 2019)
+    ]
+    cache_catalog.replace("pbp", [2019], entries)
+    df = nfldata.load("pbp", [2019])
+    assert len(sources["pbp"].calls) == 2
+    assert df["epa"].equals(fake_pbp([2019])["epa"])
+
+
+def test_load_update_incremental(sources, monkeypatch):
+    nfldata.load("schedule", [2019])
+    before = nfldata.cache_info("schedule").set_index("week")
+
+    def changed_schedule(years: list[int]) -> pandas.DataFrame:
+        df = fake_schedule(years)
+        df.loc[df["week"] == 3, "home_score"] += 1.0
+        return df[df["week"] != 2]
+
+    monkeypatch.setitem(nfldata.NFL_DATA_FUNCS, "schedule", changed_schedule)
+    df = nfldata.load("schedule", [2019], update=True)
+    after = nfldata.cache_info("schedule").set_index("week")
+    assert after.index.tolist() == [1, 3]
+    assert after.loc[1, "fetched_at"] == before.loc[1, "fetched_at"]
+    assert after.loc[1, "checked_at"] > before.loc[1, "checked_at"]
+    assert after.loc[3, "fetched_at"] > before.loc[3, "fetched_at"]
+    assert after.loc[3, "content_hash"] != before.loc[3, "content_hash"]
+    assert df["week"].unique().tolist() == [1, 3]
+
+
+def test_load_update_incremental_categories(sources, tmp_path, monkeypatch):
+    nfldata.load("pbp", [2019])
+    before = nfldata.cache_info("pbp").set_index("week")
+    path = tmp_path / "pbp/season=2019/week=1/part-0.parquet"
+    mtime = os.stat(path).st_mtime_ns
+
+    def new_team_pbp(years: list[int]) -> pandas.DataFrame:
+        df = fake_pbp(years)
+        df.loc[df["week"] == 2, "posteam"] = "SF"
+        return df
+
+    monkeypatch.setitem(nfldata.NFL_DATA_FUNCS, "pbp", new_team_pbp)
+    df = nfldata.load("pbp", [2019], update=True)
+    after = nfldata.cache_info("pbp").set_index("week")
+    assert after.loc[1, "content_hash"] == before.loc[1, "content_hash"]
+    assert after.loc[1, "fetched_at"] == before.loc[1, "fetched_at"]
+    assert os.stat(path).st_mtime_ns == mtime
+    assert after.loc[2, "content_hash"] != before.loc[2, "content_hash"]
+    assert df.loc[df["week"] == 2, "posteam"].unique().tolist() == ["SF"]
+
+
+def test_load_async(sources, monkeypatch):
+    def slow_schedule(years: list[int]) -> pandas.DataFrame:
+        time.sleep(0.2)
+        return fake_schedule(years)
+
+    source = FakeSource(slow_schedule)
+    monkeypatch.setitem(nfldata.NFL_DATA_FUNCS, "schedule", source)
+
+    async def main():
+        first, second = await asyncio.gather(
+            nfldata.load_async("schedule", [2019]),
+            nfldata.load_async("schedule", [2019]),
+        )
+        many = await nfldata.load_many_async({"schedule": [2019], "roster": [2020]})
+        return first, second, many
+
+    first, second, many = asyncio.run(main())
+    assert source.calls == [[2019]]
+    assert first.equals(second)
+    assert many["schedule"].equals(first)
+    assert many["roster"]["season"].unique().tolist() == [2020]
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_load_single_flight_processes(sources, tmp_path, monkeypatch):
+    calls_path = tmp_path / "calls.txt"
+
+    def slow_schedule(years: list[int]) -> pandas.DataFrame:
+        with open(calls_path, "a") as file:
+            file.write(f"{years}\n")
+        time.sleep(0.5)
+        return fake_schedule(years)
+
+    monkeypatch.setitem(nfldata.NFL_DATA_FUNCS, "schedule", slow_schedule)
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=nfldata.load, args=("schedule", [2019]))
+        for _ in range(2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0, 0]
+    assert calls_path.read_text() == "[2019]\n"
+    assert not list((tmp_path / "schedule").rglob("*.tmp"))
+    assert nfldata.load("schedule", [2019])["season"].unique().tolist() == [2019]
+
+
+def test_cache_budget(sources, tmp_path, monkeypatch):
+    monkeypatch.setattr(nfldata, "EVICTION_GRACE", 0)
+    nfldata.load("schedule", [2018, 2019, 2020, 2021])
+    nfldata.load("schedule", [2018])
+    nfldata.pin_cache("schedule", [2019])
+    info = nfldata.cache_info("schedule")
+    assert info.loc[info["season"] == 2019, "pinned"].all()
+    monkeypatch.setitem(nfldata.CONFIG_DATA, "cache_recompress_level", 19)
+    actions = nfldata.prune_cache(0)
+    recompressed = actions.loc[actions["action"] == "recompress", "season"]
+    evicted = actions.loc[actions["action"] == "evict", "season"]
+    assert recompressed.tolist() == [2019, 2020, 2018]
+    assert evicted.tolist() == [2020, 2021, 2018]
+    info = nfldata.cache_info("schedule")
+    assert set(info["season"]) == {2019}
+    assert info["compression_level"].eq(19).all()
+    assert not (tmp_path / "schedule/season=2018").exists()
+    assert nfldata.load("schedule", [2019])["season"].unique().tolist() == [2019]
+    assert len(sources["schedule"].calls) == 4
+
+
+def test_cache_budget_readers(sources, monkeypatch):
+    nfldata.load("schedule", [2019, 2020])
+    assert nfldata.prune_cache(0).empty
+    monkeypatch.setattr(nfldata, "EVICTION_GRACE", 0)
+    chunks = nfldata.load_iter("schedule", [2019, 2020])
+    next(chunks)
+    assert nfldata.prune_cache(0).empty
+    assert next(chunks)["season"].unique().tolist() == [2020]
+    chunks.close()
+    chunks = nfldata.load_iter("schedule", [2019, 2020])
+    assert len(nfldata.prune_cache(0).index) == 2
+    with pytest.raises(FileNotFoundError):
+        list(chunks)
+
+
+def test_cache_budget_polars(sources, monkeypatch):
+    polars = pytest.importorskip("polars")
+    monkeypatch.setattr(nfldata, "EVICTION_GRACE", 0)
+    lazy = nfldata.load("schedule", [2019], backend="polars")
+    lazy = lazy.filter(polars.col("week") == 1)
+    assert nfldata.prune_cache(0).empty
+    assert lazy.collect()["season"].unique().to_list() == [2019]
+    del lazy
+    gc.collect()
+    assert len(nfldata.prune_cache(0).index) == 1
+
+
+def test_load_id_encoding(sources):
+    df = nfldata.load("schedule", [2019, 2020])
+    assert set(df["home_qb_id"].dropna()) <= set(nfldata.id_dictionary("gsis_id"))
+    codes = nfldata.load("schedule", [2019, 2020], id_encoding="int")
+    assert codes["away_qb_id"].dtype == "Int32"
+    assert codes["season"].dtype == df["season"].dtype
+    assert codes["nfl_detail_id"].isna().all()
+    gsis_ids = nfldata.id_dictionary("gsis_id")
+    assert gsis_ids[codes["home_qb_id"]].tolist() == df["home_qb_id"].tolist()
+    roster = nfldata.load("roster", [2019], id_encoding="dictionary")
+    assert roster["player_id"].dtype == "category"
+    gsis_ids_after = nfldata.id_dictionary("gsis_id")
+    assert roster["player_id"].cat.categories.tolist() == gsis_ids_after.tolist()
+    assert gsis_ids_after[: len(gsis_ids)].equals(gsis_ids)
+    table = nfldata.load(
+        "schedule",
+        [2020],
+        filters=[("away_qb_id", "==", "00-0020200")],
+        backend="arrow",
+        id_encoding="int",
+    )
+    code = gsis_ids.tolist().index("00-0020200")
+    assert table["away_qb_id"].to_pylist() == [code] * 3
+    with pytest.raises(ValueError):
+        nfldata.load("schedule", [2019], id_encoding="float")
+
+
+def test_load_id_encoding_polars(sources):
+    polars = pytest.importorskip("polars")
+    lazy = nfldata.load("roster", [2019, 2020], backend="polars", id_encoding="int")
+    codes = nfldata.load("roster", [2019, 2020], id_encoding="int")
+    assert lazy.collect()["player_id"].to_list() == codes["player_id"].tolist()
+    lazy = nfldata.load("roster", [2019], backend="polars", id_encoding="dictionary")
+    assert isinstance(lazy.collect_schema()["player_id"], polars.Enum)
+
+
+def test_load_id_encoding_polars_stale(sources, monkeypatch):
+    pytest.importorskip("polars")
+    nfldata.load("schedule", [2019], backend="polars", id_encoding="int").collect()
+    # Another process caching 2020 adds its IDs to the catalog behind the
+    # dictionaries this process has read.
+    stale = dict(nfldata.ID_DICTIONARIES)
+    nfldata.load("schedule", [2020])
+    monkeypatch.setattr(nfldata, "ID_DICTIONARIES", stale)
+    lazy = nfldata.load("schedule", [2019, 2020], backend="polars", id_encoding="int")
+    codes = nfldata.load("schedule", [2019, 2020], id_encoding="int")
+    assert lazy.collect()["game_id"].to_list() == codes["game_id"].tolist()
+
+
+def test_load_canonical_teams(sources):
+    schedule = nfldata.load("schedule", [2019], canonical_teams=True)
+    assert schedule["home_team"].dtype == nfldata.team_dtype()
+    assert set(schedule["home_team"]) == {"KAN", "BUF", "GNB", "ARI"}
+    roster = nfldata.load("roster", [2019], canonical_teams=True)
+    assert roster["team"].dtype == schedule["away_team"].dtype
+    assert roster["team"].tolist()[:2] == ["KAN", "CIN"]
+    pbp = nfldata.load("pbp", [2019], compact=True, canonical_teams=True)
+    assert pbp["posteam"].dtype == nfldata.team_dtype()
+    merged = pbp.merge(schedule, left_on="posteam", right_on="home_team")
+    assert merged["posteam"].dtype == nfldata.team_dtype()
+    table = nfldata.load(
+        "schedule",
+        [2019],
+        filters=[("home_team", "==", "KC")],
+        backend="arrow",
+        canonical_teams=True,
+    )
+    assert table["home_team"].type.index_type == pyarrow.int8()
+    assert set(table["home_team"].to_pylist()) == {"KAN"}
+
+
+def test_load_canonical_teams_polars(sources):
+    polars = pytest.importorskip("polars")
+    df = nfldata.load("schedule", [2019, 2020], canonical_teams=True)
+    lazy = nfldata.load(
+        "schedule", [2019, 2020], backend="polars", canonical_teams=True
+    )
+    assert isinstance(lazy.collect_schema()["home_team"], polars.Enum)
+    assert lazy.collect()["home_team"].to_list() == df["home_team"].tolist()
+
+
+def test_load_iter_encoded(sources):
+    df = nfldata.load("schedule", [2019, 2020], id_encoding="int", canonical_teams=True)
+    for chunk, rows in [("season", None), ("week", None), ("season", 2)]:
+        chunks = nfldata.load_iter(
+            "schedule",
+            [2019, 2020],
+            chunk=chunk,
+            rows=rows,
+            id_encoding="int",
+            canonical_teams=True,
+        )
+        iterated = pandas.concat(list(chunks), ignore_index=True)
+        assert iterated["home_qb_id"].dtype == "Int32"
+        assert iterated["home_qb_id"].tolist() == df["home_qb_id"].tolist()
+        assert iterated["home_team"].dtype == nfldata.team_dtype()
+        assert iterated["home_team"].tolist() == df["home_team"].tolist()
+    chunks = nfldata.load_iter(
+        "schedule", [2019], backend="arrow", id_encoding="dictionary"
+    )
+    assert pyarrow.types.is_dictionary(next(chunks).schema.field("home_qb_id").type)
+    with pytest.raises(ValueError):
+        nfldata.load_iter("schedule", [2019], id_encoding="bytes")
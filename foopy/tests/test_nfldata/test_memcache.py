@@ -0,0 +1,53 @@
+from ...nfldata import nfldata
+from ...nfldata.memcache import FrameCache
+from .fake_data import FakeSource, fake_schedule
+import pandas
+import pytest
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    monkeypatch.setitem(nfldata.CONFIG_DATA, "cache_dir", str(tmp_path) + "/")
+    source = FakeSource(fake_schedule)
+    monkeypatch.setitem(nfldata.NFL_DATA_FUNCS, "schedule", source)
+    monkeypatch.setattr(nfldata, "FRAME_CACHE", FrameCache())
+    return source
+
+
+def test_memory_cache_hits(source, monkeypatch):
+    nfldata.set_memory_cache(10**8)
+    df = nfldata.load("schedule", [2019], columns=["game_id", "week"])
+    monkeypatch.setattr(nfldata, "_load_cached", None)
+    df["week"] = 0
+    cached = nfldata.load("schedule", [2019], columns=["game_id", "week"])
+    assert cached["week"].tolist() == [1, 1, 2, 2, 3, 3]
+    stats = nfldata.memory_cache_info()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_memory_cache_eviction():
+    df = pandas.DataFrame({"a": range(100)})
+    nbytes = int(df.memory_usage(index=True, deep=True).sum())
+    cache = FrameCache(2 * nbytes)
+    cache.put(("a",), df)
+    cache.put(("b",), df)
+    cache.get(("a",))
+    cache.put(("c",), df)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_cache_shared(source, tmp_path, monkeypatch):
+    nfldata.set_memory_cache(10**8, copy=False)
+    df = nfldata.load("schedule", [2019])
+    assert nfldata.load("schedule", [2019]) is df
+    with pytest.raises(ValueError):
+        df.loc[0, "home_score"] = 0.0
+    with pytest.raises(ValueError):
+        df.loc[0, "game_id"] = "x"
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.setitem(nfldata.CONFIG_DATA, "cache_dir", str(other))
+    assert nfldata.load("schedule", [2019]) is not df
+    assert len(source.calls) == 2
@@ -0,0 +1,61 @@
+from ...nfldata import nfldata
+from ...nfldata.sources import Source, MirrorSource
+from .fake_data import fake_schedule, fake_roster
+import os
+import pytest
+
+
+@pytest.fixture
+def mirror(sources, tmp_path, monkeypatch):
+    mirror_dir = tmp_path / "mirror"
+    mirror_dir.mkdir()
+    fake_schedule([2019, 2020, 2021]).to_csv(mirror_dir / "games.csv", index=False)
+    for year in [2019, 2020]:
+        path = mirror_dir / f"roster_weekly_{year}.parquet"
+        fake_roster([year]).to_parquet(path, index=False)
+    monkeypatch.setattr(nfldata, "SOURCE", nfldata.SOURCE)
+    nfldata.set_source(MirrorSource(str(mirror_dir)))
+    return mirror_dir
+
+
+def test_mirror_source(mirror, sources):
+    schedule = nfldata.load("schedule", [2020, 2019], workers=2)
+    expected = fake_schedule([2020, 2019])
+    columns = ["game_id", "season", "week", "home_team", "home_score"]
+    assert schedule[columns].equals(expected[columns])
+    roster = nfldata.load("roster", [2019, 2020])
+    assert roster["draft_id"].iloc[0] == "KAN10PatrickMahomes"
+    assert roster["season"].unique().tolist() == [2019, 2020]
+    assert sources["schedule"].calls == [] and sources["roster"].calls == []
+    with pytest.raises(FileNotFoundError):
+        nfldata.load("roster", [2021])
+
+
+def test_mirror_source_fetch(mirror):
+    source = MirrorSource(str(mirror))
+    df = source.fetch("roster", [2019, 2020])
+    assert df.equals(fake_roster([2019, 2020]))
+    reads = []
+    read = source.read
+    source.read = lambda path: reads.append(path) or read(path)
+    for year in [2019, 2020, 2021]:
+        assert source.fetch("schedule", [year])["season"].unique().tolist() == [year]
+    source.fetch("roster", [2019])
+    source.fetch("schedule", [2019])
+    assert [os.path.basename(path) for path in reads].count("games.csv") == 1
+    with pytest.raises(ValueError):
+        MirrorSource(str(mirror / "missing"))
+
+
+def test_mirror_source_mixed(mirror, sources):
+    nfldata.load("schedule", [2019])
+    info = nfldata.cache_info("schedule")
+    assert info["source"].unique().tolist() == ["nflverse_mirror"]
+    nfldata.set_source(None)
+    with pytest.raises(ValueError):
+        nfldata.load("schedule", [2020])
+    assert sources["schedule"].calls == []
+    nfldata.set_source(MirrorSource(str(mirror)))
+    nfldata.load("schedule", [2020])
+    with pytest.raises(TypeError):
+        Source()
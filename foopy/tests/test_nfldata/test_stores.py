@@ -0,0 +1,38 @@
+from ...nfldata import nfldata
+from ...nfldata.stores import Store, LocalStore, MemoryStore, FsspecStore
+import json
+import pytest
+
+
+@pytest.fixture(params=["memory", "local", "fsspec"])
+def store(request, tmp_path, monkeypatch):
+    if request.param == "memory":
+        store = MemoryStore()
+    elif request.param == "local":
+        store = LocalStore(str(tmp_path / "shared"))
+    else:
+        pytest.importorskip("fsspec")
+        store = FsspecStore(f"memory://{tmp_path.name}/shared")
+    monkeypatch.setattr(nfldata, "SHARED_STORE", None)
+    nfldata.set_shared_store(store)
+    return store
+
+
+def test_shared_store(sources, store, tmp_path, monkeypatch):
+    df = nfldata.load("schedule", [2019, 2020])
+    assert store.exists("_manifests/schedule/2019.json")
+    assert store.exists("schedule/season=2019/week=1/part-0.parquet")
+    manifest = json.loads(store.read("_manifests/schedule/2019.json"))
+    assert manifest["source"] == "nfl_data_py"
+    (tmp_path / "node2").mkdir()
+    monkeypatch.setitem(nfldata.CONFIG_DATA, "cache_dir", str(tmp_path / "node2"))
+    assert nfldata.load("schedule", [2019, 2020]).equals(df)
+    assert sorted(sources["schedule"].calls) == [[2019], [2020]]
+    assert set(nfldata.cache_info("schedule")["season"]) == {2019, 2020}
+    nfldata.load("schedule", [2019, 2020], update=True)
+    assert sorted(sources["schedule"].calls) == [[2019], [2020], [2020]]
+
+
+def test_store_abstract():
+    with pytest.raises(TypeError):
+        Store()
@@ -0,0 +1,124 @@
+from ...nfldata import nfldata, cols
+import numpy
+import pandas
+import pytest
+
+
+def test_clean_IDs():
+    df = pandas.DataFrame(
+        {
+            "player_id": ["00-0030", "", None],
+            "espn_id": [3139477.0, numpy.nan, 12.0],
+            "yahoo_id": pandas.array([30123, "30124", None], dtype=object),
+            "esb_id": pandas.Categorical(["MAH0", "MAH0", None]),
+            "smart_id": [None, None, None],
+            "team": ["KC", "", "BUF"],
+        },
+        index=[5, 6, 7],
+    )
+    df = nfldata._clean_IDs("roster", df)
+    assert df["player_id"].tolist() == ["00-0030", None, None]
+    assert df["espn_id"].tolist() == ["3139477", None, "12"]
+    assert df["yahoo_id"].tolist() == ["30123", "30124", None]
+    assert df["esb_id"].tolist() == ["MAH0", "MAH0", None]
+    assert df["smart_id"].tolist() == [None, None, None]
+    assert df["team"].tolist() == ["KC", "", "BUF"]
+    assert df.index.tolist() == [5, 6, 7]
+
+
+def test_clean_IDs_pbp():
+    df = pandas.DataFrame(
+        {
+            "play_id": [1.0, 40.0],
+            "old_game_id_x": ["2019090500", None],
+            "passer_player_id": ["00-0033873", ""],
+            "epa": [0.5, -0.5],
+        }
+    )
+    df = nfldata._clean_IDs("pbp", df)
+    assert df["play_id"].tolist() == ["1", "40"]
+    assert df["old_game_id_x"].tolist() == ["2019090500", None]
+    assert df["passer_player_id"].tolist() == ["00-0033873", None]
+    assert df["epa"].tolist() == [0.5, -0.5]
+
+
+# The draft ID builder is checked against the element-wise implementation it
+# replaced, on randomly generated frames.
+
+
+def create_draft_id_reference(data_name: str, df: pandas.DataFrame) -> pandas.Series:
+    if data_name == "draft":
+        team = df[cols.draft.Team.header]
+        round_ = df[cols.draft.Round.header].fillna(0)
+        pick = df[cols.draft.Pick.header].fillna(0)
+        pick_less_32 = pick <= 32
+        overall = ((pick_less_32) * (pick * round_)) + ((~pick_less_32) * pick)
+        name = df[cols.draft.PfrPlayerName.header]
+    elif data_name == "player":
+        team = df[cols.player.DraftClub.header]
+        overall = df[cols.player.DraftNumber.header].fillna(0)
+        name = df[cols.player.DisplayName.header]
+    elif data_name == "roster":
+        team = df[cols.roster.DraftClub.header]
+        overall = df[cols.roster.DraftNumber.header].fillna(0)
+        name = df[cols.roster.PlayerName.header]
+    team = team.apply(nfldata._team_abbrs().get)
+    overall = overall.astype(int).astype(str).replace("0", None)
+    name = (
+        name.str.replace(" ", "", regex=False)
+        .str.replace(".", "", regex=False)
+        .str.replace("-", "", regex=False)
+        .str.replace("'", "", regex=False)
+    )
+    return (team.notna() & overall.notna() & name.notna()) * (team + overall + name)
+
+
+def random_draft_frame(data_name: str, rows: int, seed: int) -> pandas.DataFrame:
+    rng = numpy.random.default_rng(seed)
+    teams = list(nfldata._team_abbrs()) + ["XXX", "", None]
+    letters = list("abcXYZ .-'é")
+
+    def random_name():
+        if rng.random() < 0.1:
+            return None
+        return "".join(rng.choice(letters, rng.integers(0, 12)))
+
+    def random_numbers(high):
+        numbers = rng.integers(0, high, rows).astype(float)
+        numbers[rng.random(rows) < 0.1] = numpy.nan
+        return numbers
+
+    team = [teams[index] for index in rng.integers(0, len(teams), rows)]
+    name = [random_name() for _ in range(rows)]
+    if data_name == "draft":
+        return pandas.DataFrame(
+            {
+                cols.draft.Team.header: team,
+                cols.draft.Round.header: random_numbers(8),
+                cols.draft.Pick.header: random_numbers(260),
+                cols.draft.PfrPlayerName.header: name,
+            },
+            index=rng.permutation(rows),
+        )
+    data_cols = cols.player if data_name == "player" else cols.roster
+    name_col = (
+        cols.player.DisplayName if data_name == "player" else cols.roster.PlayerName
+    )
+    return pandas.DataFrame(
+        {
+            data_cols.DraftClub.header: team,
+            data_cols.DraftNumber.header: random_numbers(260),
+            name_col.header: name,
+        },
+        index=rng.permutation(rows),
+    )
+
+
+@pytest.mark.parametrize("data_name", ["draft", "player", "roster"])
+@pytest.mark.parametrize("seed", range(10))
+def test_create_draft_id(data_name, seed):
+    df = random_draft_frame(data_name, 200, seed)
+    expected = create_draft_id_reference(data_name, df.copy())
+    draft_id = nfldata._create_draft_id(data_name, df)[cols.draft.DraftId.header]
+    assert draft_id.index.equals(expected.index)
+    assert draft_id.tolist() == expected.where(expected.notna(), None).tolist()